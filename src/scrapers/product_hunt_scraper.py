@@ -1,14 +1,22 @@
 import os
+import re
+import gzip
 import time
-import json
+import logging
+import orjson
 import requests
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dotenv import load_dotenv
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Set, Tuple
 from datetime import datetime, timedelta
 
 # Load environment variables
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 # Use a constant User-Agent for both token and GraphQL requests
 USER_AGENT = (
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
@@ -16,6 +24,118 @@ USER_AGENT = (
     "Chrome/99.0.4844.74 Safari/537.36"
 )
 
+# Where the OAuth token is cached between runs, and how long a token without
+# an expires_in is trusted for
+TOKEN_CACHE_PATH = os.path.expanduser("~/.cache/aideator/ph_token.json")
+DEFAULT_TOKEN_TTL = 24 * 3600
+
+# Write buffer for the JSON save paths (1 MiB)
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Gzip level for compressed (.gz) JSON files; low levels keep compression cheap
+GZIP_LEVEL = 3
+
+# Legacy single-file output read by downstream consumers, and the per-year files written during a run
+COMBINED_FILENAME = "producthunt_all_years.json"
+YEAR_FILE_RE = re.compile(r"^producthunt_(\d{4})\.json(\.gz)?$")
+
+
+def _atomic_write_json(path: str, obj: Any) -> None:
+    """
+    Serialize obj as compact UTF-8 JSON with orjson and write it to path in one buffered write.
+    The data goes to a temporary file first and is then moved over path, so readers never see a partial file.
+    Paths ending in .gz are gzip-compressed.
+    """
+    tmp = path + ".tmp"
+    if path.endswith(".gz"):
+        with gzip.open(tmp, "wb", compresslevel=GZIP_LEVEL) as f:
+            f.write(orjson.dumps(obj))
+    else:
+        with open(tmp, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+            f.write(orjson.dumps(obj))
+    os.replace(tmp, path)
+
+
+# Posts in a date window, highest voted first
+QUERY_POSTS_BY_DATE = """
+query ProductsByDate($first: Int!, $after: String, $postedAfter: DateTime!, $postedBefore: DateTime!) {
+posts(
+    first: $first,
+    after: $after,
+    postedAfter: $postedAfter,
+    postedBefore: $postedBefore,
+    order: VOTES
+) {
+    pageInfo {
+    hasNextPage
+    endCursor
+    }
+    edges {
+    node {
+        id
+        name
+        tagline
+        description
+        website
+        votesCount
+        thumbnail {
+        url
+        }
+    }
+    }
+}
+}
+"""
+
+# Most recent posts
+QUERY_LATEST_POSTS = """
+query GetLatestProducts($first: Int!, $after: String) {
+posts(first: $first, after: $after, order: NEWEST) {
+    pageInfo {
+    hasNextPage
+    endCursor
+    }
+    edges {
+    node {
+        name
+        tagline
+        description
+        website
+        thumbnail {
+        url
+        }
+    }
+    }
+}
+}
+"""
+
+# The bare "description" line in a node selection set
+_DESCRIPTION_FIELD_RE = re.compile(r"^[ \t]*description[ \t]*\n", re.MULTILINE)
+
+
+# Shared read-only fallback for missing nested objects; never mutate
+_EMPTY: Dict[str, Any] = {}
+
+
+def _node_to_product(node: Dict[str, Any]) -> Dict[str, Any]:
+    """Map a GraphQL post node onto the scraper's product fields."""
+    get = node.get
+    return {
+        "title": node["name"],
+        "blurb": get("tagline", ""),
+        "description": get("description", ""),
+        "url": get("website", ""),
+        "profile_picture": (get("thumbnail") or _EMPTY).get("url", ""),
+        "source": "producthunt"
+    }
+
+
+def _product_key(product: Dict[str, Any]) -> Tuple[str, str]:
+    """Return the dedup key for a product: its (title, url) pair."""
+    return (product.get("title", ""), product.get("url", ""))
+
+
 # Custom exception for rate limiting
 class RateLimitExceeded(Exception):
     """Exception raised when API rate limit is exceeded."""
@@ -45,14 +165,14 @@ class APIRequestCounter:
             # If over daily limit, sleep until reset
             if self.daily_requests >= self.daily_limit:
                 wait_time = self.daily_reset - now
-                print(f"Daily API limit hit. Waiting {wait_time/60:.1f} minutes…")
+                logger.info(f"Daily API limit hit. Waiting {wait_time/60:.1f} minutes…")
                 time.sleep(wait_time)
                 continue  # re-check after sleep
 
             # If over hourly limit, sleep until reset
             if self.hourly_requests >= self.hourly_limit:
                 wait_time = self.hourly_reset - now
-                print(f"Hourly API limit hit. Waiting {wait_time/60:.1f} minutes…")
+                logger.info(f"Hourly API limit hit. Waiting {wait_time/60:.1f} minutes…")
                 time.sleep(wait_time)
                 continue
 
@@ -64,11 +184,80 @@ class APIRequestCounter:
         self.hourly_requests += 1
 
 
-def get_oauth_token(client_id: str, client_secret: str) -> Optional[str]:
+def _build_session() -> requests.Session:
+    """
+    Create a pooled session for api.producthunt.com with transparent retries on transient errors.
+    429s are deliberately not retried here: _post_graphql owns rate limiting, and retries inside
+    the adapter would bypass APIRequestCounter.
+    """
+    session = requests.Session()
+    retry = Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=[500, 502, 503, 504],
+        allowed_methods=frozenset(["GET", "POST"]),  # GraphQL reads are POSTs, and safe to repeat
+        respect_retry_after_header=True,
+        raise_on_status=False  # hand the final response back to raise_for_status in _post_graphql
+    )
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry))
+    return session
+
+
+def _load_cached_token(cache_path: str, client_id: str) -> Optional[str]:
+    """Return the cached token for client_id if it is still valid for at least another minute."""
+    try:
+        with open(cache_path, "rb") as f:
+            cached = orjson.loads(f.read())
+    except (FileNotFoundError, orjson.JSONDecodeError, IOError):
+        return None
+    if cached.get("client_id") != client_id or time.time() > cached.get("expires_at", 0) - 60:
+        return None
+    return cached.get("access_token")
+
+
+def _save_cached_token(cache_path: str, client_id: str, token: str, expires_in: float) -> None:
+    """Persist the token readable only by the current user."""
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        tmp = cache_path + ".tmp"
+        with open(os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), "wb") as f:
+            f.write(orjson.dumps({
+                "client_id": client_id,
+                "access_token": token,
+                "expires_at": time.time() + expires_in
+            }))
+        os.replace(tmp, cache_path)
+    except IOError as e:
+        logger.error(f"Could not cache token: {e}")
+
+
+def _clear_cached_token(cache_path: str) -> None:
+    """Forget the cached token, e.g. after the API has rejected it."""
+    try:
+        os.remove(cache_path)
+    except FileNotFoundError:
+        pass
+    except IOError as e:
+        logger.error(f"Could not remove cached token: {e}")
+
+
+def get_oauth_token(
+    client_id: str,
+    client_secret: str,
+    session: Optional[requests.Session] = None,
+    cache_path: Optional[str] = TOKEN_CACHE_PATH
+) -> Optional[str]:
     """
     Obtain an OAuth2 client_credentials token from Product Hunt.
     Includes browser-like headers to bypass Cloudflare challenge.
+    Pass the scraper's session so the token request warms its connection pool.
+    A still-valid token cached at cache_path is reused; pass cache_path=None to always fetch.
     """
+    if cache_path:
+        token = _load_cached_token(cache_path, client_id)
+        if token:
+            return token
+
     token_url = "https://api.producthunt.com/v2/oauth/token"
     headers = {
         "Content-Type": "application/json",
@@ -84,7 +273,7 @@ def get_oauth_token(client_id: str, client_secret: str) -> Optional[str]:
     }
 
     try:
-        resp = requests.post(
+        resp = (session or requests).post(
             token_url,
             json=payload,
             headers=headers,
@@ -92,16 +281,18 @@ def get_oauth_token(client_id: str, client_secret: str) -> Optional[str]:
         )
         resp.raise_for_status()
     except requests.exceptions.HTTPError:
-        print(f"Failed to get token: {resp.status_code}\n{resp.text}")
+        logger.error(f"Failed to get token: {resp.status_code}\n{resp.text}")
         return None
     except requests.exceptions.RequestException as e:
-        print(f"Token request error: {e}")
+        logger.error(f"Token request error: {e}")
         return None
 
     data = resp.json()
     token = data.get("access_token")
     if not token:
-        print(f"No access_token in response: {data}")
+        logger.error(f"No access_token in response: {data}")
+    elif cache_path:
+        _save_cached_token(cache_path, client_id, token, data.get("expires_in") or DEFAULT_TOKEN_TTL)
     return token
 
 
@@ -125,8 +316,12 @@ class ProductHuntScraper:
                 " Set PRODUCTHUNT_CLIENT_ID and PRODUCTHUNT_CLIENT_SECRET in .env"
             )
         
+        # Persistent pooled session so the token fetch and every GraphQL page
+        # reuse the same keep-alive connection
+        self.session = _build_session()
+        
         # Fetch OAuth token
-        self.access_token = get_oauth_token(self.client_id, self.client_secret)
+        self.access_token = get_oauth_token(self.client_id, self.client_secret, self.session)
         if not self.access_token:
             raise ValueError("Failed to obtain OAuth token")
 
@@ -136,12 +331,20 @@ class ProductHuntScraper:
             "Authorization": f"Bearer {self.access_token}",
             "Content-Type": "application/json",
             "Accept": "application/json",
+            "Accept-Encoding": "gzip, deflate",
             "User-Agent": USER_AGENT
         }
 
+        self.session.headers.update(self.headers)
+
         # Rate limit settings
         self.request_delay = base_delay
+        self.base_delay = base_delay
+        self.adaptive_delay = base_delay  # grows on 429s, decays back on successful responses
         self.last_request_time = 0.0
+        self.rate_limit_remaining: Optional[int] = None  # from X-Rate-Limit-Remaining
+        self.rate_limit_reset_at = 0.0                    # epoch time the API budget resets
+        self.rate_limit_threshold = 10                    # wait for reset at or below this
         self.retry_count = 0
         self.max_retries = 5
         
@@ -160,20 +363,78 @@ class ProductHuntScraper:
         self.all_products        = {}            # global store of everything so far
         self.global_save_path    = None          # where to write the combined JSON
 
+        # In-memory mirror of the combined file and its dedup keys, kept across flushes
+        self._combined_data: Optional[Dict[str, List[Dict[str, Any]]]] = None
+        self._combined_keys_by_year: Dict[str, Set[Tuple[str, str]]] = {}
+        self._combined_synced: Dict[str, int] = {}   # products of all_products[year] already merged
+
+        # Keys of every product returned by _fetch_products_for_month this session
+        self._global_product_keys: Set[Tuple[str, str]] = set()
+
+        # Per-period dedup keys: period file path -> keys of the products in that file.
+        # Only the keys are cached; an entry must be dropped whenever the file is rewritten elsewhere
+        self._period_keys: Dict[str, Set[Tuple[str, str]]] = {}
+        
+        # Per-year file writes run on a single background thread (so they stay
+        # ordered) while the scrape carries on with the next request
+        self._io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ph-writer")
+        self._pending_writes: List[Tuple[str, Future]] = []  # (year, write)
+
+    def close(self) -> None:
+        """Wait for queued file writes, then close the underlying HTTP session."""
+        self._wait_for_writes()
+        self._io_pool.shutdown(wait=True)
+        self.session.close()
+
+    def _wait_for_writes(self) -> None:
+        """Block until every queued background write has finished, re-raising any failure."""
+        pending, self._pending_writes = self._pending_writes, []
+        for _, future in pending:
+            future.result()
+
+    def _check_writes(self) -> Set[str]:
+        """Log the background writes that have failed and return their years; keep those still running."""
+        still_pending = []
+        failed_years = set()
+        for year, future in self._pending_writes:
+            if not future.done():
+                still_pending.append((year, future))
+            elif future.exception() is not None:
+                logger.error(f"Writing {self._year_file(year)} failed: {future.exception()}")
+                failed_years.add(year)
+        self._pending_writes = still_pending
+        return failed_years
+
+    @staticmethod
+    def _build_query(query: str, include_description: bool = True) -> str:
+        """Drop the heavy description field from a posts query unless it is wanted."""
+        if include_description:
+            return query
+        return _DESCRIPTION_FIELD_RE.sub("", query)
+
     def _respect_rate_limit(self) -> None:
         """Respect rate limits with exponential backoff on 429 errors"""
         # First check if we're approaching API limits
         self.request_counter.check_limits()
         
-        # Then handle regular rate limiting
-        elapsed = time.time() - self.last_request_time
-        if elapsed < self.request_delay:
-            time.sleep(self.request_delay - elapsed)
+        # Then follow the budget the API reported on the previous response: run
+        # freely while it has headroom, wait for the window reset once it runs low
+        if self.rate_limit_remaining is not None:
+            if self.rate_limit_remaining <= self.rate_limit_threshold:
+                wait_time = self.rate_limit_reset_at - time.time()
+                if wait_time > 0:
+                    logger.info(f"API budget low ({self.rate_limit_remaining} left), waiting {wait_time:.0f}s for reset...")
+                    time.sleep(wait_time)
+        else:
+            # No budget information yet, fall back to the fixed delay
+            elapsed = time.time() - self.last_request_time
+            if elapsed < self.request_delay:
+                time.sleep(self.request_delay - elapsed)
         
         # If we've had 429 errors recently, add exponential backoff
         if self.retry_count > 0:
             backoff_time = min(300, 2 ** self.retry_count)  # Cap at 5 minutes
-            print(f"⚠️ Rate limited, backing off for {backoff_time} seconds...")
+            logger.warning(f"⚠️ Rate limited, backing off for {backoff_time} seconds...")
             time.sleep(backoff_time)
             # Decrease retry count over time
             self.retry_count = max(0, self.retry_count - 1)
@@ -181,13 +442,72 @@ class ProductHuntScraper:
         self.last_request_time = time.time()
         self.request_counter.increment()
 
+    def _update_rate_limit(self, resp: requests.Response) -> None:
+        """Record the remaining request budget from Product Hunt's X-Rate-Limit-* headers."""
+        remaining = resp.headers.get("X-Rate-Limit-Remaining")
+        reset = resp.headers.get("X-Rate-Limit-Reset")  # seconds until the window resets
+        try:
+            if remaining is not None:
+                self.rate_limit_remaining = int(remaining)
+            if reset is not None:
+                self.rate_limit_reset_at = time.time() + float(reset)
+        except ValueError:
+            pass
+
+    def _refresh_token(self) -> None:
+        """Drop the cached token, which the API has rejected, and fetch a new one."""
+        _clear_cached_token(TOKEN_CACHE_PATH)
+        self.session.headers.pop("Authorization", None)  # don't send the rejected token to the token endpoint
+        self.access_token = get_oauth_token(self.client_id, self.client_secret, self.session)
+        if not self.access_token:
+            raise ValueError("Failed to obtain OAuth token")
+        self.headers["Authorization"] = f"Bearer {self.access_token}"
+        self.session.headers["Authorization"] = self.headers["Authorization"]
+
+    def _post_graphql(self, query: str, variables: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        POST one GraphQL request and return the decoded response body.
+        On a 401 the token is refreshed and the request retried once.
+        Returns None after backing off on a 429 so the caller can retry the same page,
+        and raises RateLimitExceeded once max_retries consecutive 429s have been seen.
+        """
+        body = orjson.dumps({"query": query, "variables": variables})  # Content-Type is set on the session
+        resp = self.session.post(self.api_url, data=body, timeout=15)
+        if resp.status_code == 401:
+            logger.warning("🔑 Access token rejected (401), fetching a new one...")
+            self._refresh_token()
+            resp = self.session.post(self.api_url, data=body, timeout=15)
+        self._update_rate_limit(resp)
+        
+        # Handle rate limiting
+        if resp.status_code == 429:
+            self.retry_count += 1
+            self.adaptive_delay = min(300, self.adaptive_delay * 2)
+            if self.retry_count > self.max_retries:
+                logger.warning("⛔ Maximum retries reached")
+                raise RateLimitExceeded("Rate limit exceeded (429)")
+            backoff_time = min(300, 2 ** self.retry_count)
+            logger.warning(f"⚠️ Rate limited (429). Backing off for {backoff_time} seconds...")
+            time.sleep(backoff_time)
+            return None
+        
+        # Handle other errors
+        resp.raise_for_status()
+        data = orjson.loads(resp.content)
+        
+        # Reset retry count on successful response
+        if self.retry_count > 0:
+            self.retry_count = max(0, self.retry_count - 1)
+        self.adaptive_delay = max(self.base_delay, self.adaptive_delay * 0.9)
+        return data
+
     def _load_checkpoint(self) -> Dict[str, Any]:
         """Load enhanced checkpoint data with product-level tracking"""
         if os.path.exists(self.checkpoint_file):
             try:
-                with open(self.checkpoint_file, "r") as f:
-                    checkpoint = json.load(f)
-                    print(f"Loaded checkpoint from {self.checkpoint_file}")
+                with open(self.checkpoint_file, "rb") as f:
+                    checkpoint = orjson.loads(f.read())
+                    logger.debug(f"Loaded checkpoint from {self.checkpoint_file}")
                     
                     # Ensure the structure includes product tracking if it's an older checkpoint
                     if "product_tracking" not in checkpoint:
@@ -196,8 +516,8 @@ class ProductHuntScraper:
                             "last_product_ids": {}  # Last product ID seen in each period
                         }
                     return checkpoint
-            except (json.JSONDecodeError, IOError) as e:
-                print(f"Error loading checkpoint: {e}")
+            except (orjson.JSONDecodeError, IOError) as e:
+                logger.error(f"Error loading checkpoint: {e}")
         
         # Default checkpoint structure with product tracking
         return {
@@ -219,12 +539,10 @@ class ProductHuntScraper:
     def _save_checkpoint(self, checkpoint_data: Dict[str, Any]) -> None:
         """Save enhanced checkpoint data"""
         try:
-            with open(self.checkpoint_file + ".tmp", 'w') as f:
-                json.dump(checkpoint_data, f, indent=2)
-            os.replace(self.checkpoint_file + ".tmp", self.checkpoint_file)
-            print(f"Checkpoint saved with product-level tracking")
+            _atomic_write_json(self.checkpoint_file, checkpoint_data)
+            logger.debug("Checkpoint saved with product-level tracking")
         except IOError as e:
-            print(f"Error saving checkpoint: {e}")
+            logger.error(f"Error saving checkpoint: {e}")
 
     def _update_checkpoint_with_product(self, checkpoint: Dict[str, Any], 
                                     period_name: str, product_id: str) -> None:
@@ -253,59 +571,29 @@ class ProductHuntScraper:
         period_name: str,
         save_path: Optional[str] = None,
         max_products: Optional[int] = None,
-        resume_cursor: Optional[str] = None
+        resume_cursor: Optional[str] = None,
+        include_description: bool = True
     ) -> tuple[List[Dict[str, Any]], Optional[str]]:
         """
         Fetch products for a specific time period with product-level tracking.
         Skips already seen products and continues from exactly where we left off.
         """
-        # GraphQL query with date filtering
-        query = """
-        query ProductsByDate($first: Int!, $after: String, $postedAfter: DateTime!, $postedBefore: DateTime!) {
-        posts(
-            first: $first,
-            after: $after,
-            postedAfter: $postedAfter,
-            postedBefore: $postedBefore,
-            order: VOTES
-        ) {
-            pageInfo {
-            hasNextPage
-            endCursor
-            }
-            edges {
-            node {
-                id
-                name
-                tagline
-                description
-                website
-                votesCount
-                thumbnail {
-                url
-                }
-            }
-            }
-        }
-        }
-        """
+        query = self._build_query(QUERY_POSTS_BY_DATE, include_description)
         
         # Load checkpoint to get seen products
         checkpoint = self._load_checkpoint()
         product_tracking = checkpoint.get("product_tracking", {"seen_products": {}, "last_product_ids": {}})
         seen_products = set(product_tracking.get("seen_products", {}).get(period_name, []))
         
-        print(f"Starting fetch for {period_name}" + (f" resuming from cursor" if resume_cursor else ""))
-        print(f"Already seen {len(seen_products)} products in this period")
+        logger.info(f"Starting fetch for {period_name}" + (f" resuming from cursor" if resume_cursor else ""))
+        logger.debug(f"Already seen {len(seen_products)} products in this period")
         
         # Create set of all product keys for duplicate detection
         existing_product_keys = set()
         for year_products in self.all_products.values():
-            for product in year_products:
-                product_key = (product.get("title", ""), product.get("url", ""))
-                existing_product_keys.add(product_key)
+            existing_product_keys.update(_product_key(product) for product in year_products)
         
-        print(f"Pre-loaded {len(existing_product_keys)} existing product keys for duplicate detection")
+        logger.debug(f"Pre-loaded {len(existing_product_keys)} existing product keys for duplicate detection")
         
         period_products = []
         cursor = resume_cursor
@@ -320,7 +608,7 @@ class ProductHuntScraper:
         
         while True:
             if max_products and len(period_products) >= max_products:
-                print(f"  Reached limit of {max_products} products for {period_name}")
+                logger.info(f"  Reached limit of {max_products} products for {period_name}")
                 break
             
             self._respect_rate_limit()
@@ -337,34 +625,15 @@ class ProductHuntScraper:
                 variables["after"] = cursor
             
             page_display = "resumed page" if page == "resuming" else f"page {page}"
-            print(f"  Fetching {page_display} for {period_name}...")
+            logger.debug(f"  Fetching {page_display} for {period_name}...")
             
             try:
-                resp = requests.post(
-                    self.api_url,
-                    json={"query": query, "variables": variables},
-                    headers=self.headers,
-                    timeout=15
-                )
-                
-                # Handle rate limiting
-                if resp.status_code == 429:
-                    self.retry_count += 1
-                    if self.retry_count <= self.max_retries:
-                        backoff_time = min(300, 2 ** self.retry_count)
-                        print(f"⚠️ Rate limited (429). Backing off for {backoff_time} seconds...")
-                        time.sleep(backoff_time)
-                        continue
-                    else:
-                        print(f"⛔ Maximum retries reached for {period_name}, page {page}")
-                        raise RateLimitExceeded(f"Rate limit exceeded for {period_name}")
-                
-                # Handle other errors
-                resp.raise_for_status()
-                data = resp.json()
+                data = self._post_graphql(query, variables)
+                if data is None:
+                    continue  # backed off after a 429, retry the same page
                 
                 if errors := data.get("errors"):
-                    print(f"⚠️ GraphQL errors for {period_name}, page {page}: {errors}")
+                    logger.warning(f"⚠️ GraphQL errors for {period_name}, page {page}: {errors}")
                     time.sleep(5)
                     if page > 1 or page == "resuming":
                         break
@@ -383,13 +652,9 @@ class ProductHuntScraper:
                 
                 # Check if we got any products
                 if not edges:
-                    print(f"  No products found for {period_name}, {page_display}")
+                    logger.info(f"  No products found for {period_name}, {page_display}")
                     break
                 
-                # Reset retry count on successful response
-                if self.retry_count > 0:
-                    self.retry_count = max(0, self.retry_count - 1)
-                
                 # Reset page metrics
                 products_on_page = 0
                 already_seen_on_page = 0
@@ -426,18 +691,13 @@ class ProductHuntScraper:
                     # Create simplified product object
                     product = {
                         "id": product_id,  # Add the ID for tracking
-                        "title": node["name"],
-                        "blurb": node.get("tagline", ""),
-                        "description": node.get("description", ""),
-                        "url": node.get("website", ""),
-                        "profile_picture": node.get("thumbnail", {}).get("url", ""),
-                        "source": "producthunt",
+                        **_node_to_product(node),
                         "period": period_name,
                         "votes": votes_count
                     }
                     
                     # Additional check for duplicate detection using title/URL
-                    product_key = (product["title"], product.get("url", ""))
+                    product_key = _product_key(product)
                     
                     # If it's a duplicate by title/URL but not by ID, still track it
                     if product_key in existing_product_keys:
@@ -482,41 +742,42 @@ class ProductHuntScraper:
                         break
                 
                 # After processing page, print stats and check stopping conditions
-                print(f"  Page results: {new_on_page} new, {already_seen_on_page} already seen, {low_upvotes_on_page} low upvotes (of {products_on_page} total)")
+                logger.debug(f"  Page results: {new_on_page} new, {already_seen_on_page} already seen, {low_upvotes_on_page} low upvotes (of {products_on_page} total)")
                 
                 # Stop if this page was mostly already seen
                 if products_on_page > 10 and already_seen_on_page >= products_on_page * 0.8:
-                    print(f"  Found {already_seen_on_page}/{products_on_page} already seen products on this page. Stopping search.")
+                    logger.info(f"  Found {already_seen_on_page}/{products_on_page} already seen products on this page. Stopping search.")
                     break
                     
                 # Stop if we hit our duplicate streak threshold
                 if duplicate_streak >= max_duplicate_streak:
-                    print(f"  Found {duplicate_streak} consecutive duplicate products. Stopping search.")
+                    logger.info(f"  Found {duplicate_streak} consecutive duplicate products. Stopping search.")
                     break
                 
                 # Check for low upvotes streak
                 if low_upvotes_streak >= 3:
-                    print(f"  Found {low_upvotes_streak} consecutive products with <100 upvotes. Stopping search.")
+                    logger.info(f"  Found {low_upvotes_streak} consecutive products with <100 upvotes. Stopping search.")
                     break
 
                 # Check low upvotes threshold on current page
                 if products_on_page > 0 and low_upvotes_on_page >= products_on_page * 0.8:
-                    print(f"  Found {low_upvotes_on_page}/{products_on_page} products with <100 upvotes on this page. Stopping search.")
+                    logger.info(f"  Found {low_upvotes_on_page}/{products_on_page} products with <100 upvotes on this page. Stopping search.")
                     break
                 
                 # Check if there are more pages
                 has_next_page = page_info.get("hasNextPage", False)
                 if not has_next_page:
-                    print(f"  No more pages for {period_name}")
+                    logger.info(f"  No more pages for {period_name}")
                     break
                 
                 # Get cursor for next page
                 cursor = page_info.get("endCursor")
                 if not cursor:
-                    print(f"  No cursor for next page in {period_name}, stopping.")
+                    logger.info(f"  No cursor for next page in {period_name}, stopping.")
                     break
                 
-                # Save checkpoint after each page
+                # Save checkpoint (with the cursor to resume from) after each page
+                checkpoint.setdefault("pagination_cursors", {})[period_name] = cursor
                 self._save_checkpoint(checkpoint)
                 
                 # Increment page counter
@@ -525,18 +786,15 @@ class ProductHuntScraper:
                 else:
                     page = 2
                 
-                # Add a small delay between pages
-                time.sleep(2)
-                
             except RateLimitExceeded:
-                print(f"⛔ Rate limit exceeded for {period_name}, stopping.")
+                logger.warning(f"⛔ Rate limit exceeded for {period_name}, stopping.")
                 if save_path and period_products:
                     self._append_to_period_file(period_name, period_products, save_path)
                     self._save_checkpoint(checkpoint)
-                    print(f"  Saved partial {len(period_products)} products for {period_name}")
+                    logger.info(f"  Saved partial {len(period_products)} products for {period_name}")
                 return period_products, last_saved_cursor
             except Exception as e:
-                print(f"⚠️ Error fetching {period_name}, page {page}: {str(e)}")
+                logger.warning(f"⚠️ Error fetching {period_name}, page {page}: {str(e)}")
                 if period_products:
                     self._save_checkpoint(checkpoint)
                     break
@@ -548,7 +806,7 @@ class ProductHuntScraper:
         # Save period data if requested
         if save_path and period_products:
             self._append_to_period_file(period_name, period_products, save_path)
-            print(f"  Saved {len(period_products)} products for {period_name}")
+            logger.info(f"  Saved {len(period_products)} products for {period_name}")
         
         return period_products, last_saved_cursor
 
@@ -557,7 +815,8 @@ class ProductHuntScraper:
         year: int,
         month: int,
         save_path: Optional[str] = None,
-        max_products: Optional[int] = None
+        max_products: Optional[int] = None,
+        include_description: bool = True
     ) -> List[Dict[str, Any]]:
         """
         Fetch products for a specific month, with day-by-day fallback if needed.
@@ -567,11 +826,6 @@ class ProductHuntScraper:
         month_str = f"{month:02d}"
         period_name = f"{year_str}/{month_str}"
         
-        # Add a set to track products we've seen across all fetches
-        # Use a global tracker for duplication prevention
-        if not hasattr(self, '_global_product_keys'):
-            self._global_product_keys = set()
-        
         # Get start and end dates for this month
         start_date = f"{year_str}-{month_str}-01"
         
@@ -590,40 +844,36 @@ class ProductHuntScraper:
         checkpoint = self._load_checkpoint()
         resume_cursor = checkpoint.get("pagination_cursors", {}).get(period_name)
         if resume_cursor:
-            print(f"Found saved cursor for {period_name}, will resume from exact position")
+            logger.info(f"Found saved cursor for {period_name}, will resume from exact position")
         
         # Try to fetch the whole month
         try:
-            print(f"Attempting to fetch {'remainder of' if resume_cursor else 'full'} month {period_name}...")
+            logger.info(f"Attempting to fetch {'remainder of' if resume_cursor else 'full'} month {period_name}...")
             month_products, last_cursor = self._fetch_products_for_period(
                 start_date=start_date,
                 end_date=end_date,
                 period_name=period_name,
                 save_path=save_path,
                 max_products=max_products,
-                resume_cursor=resume_cursor
+                resume_cursor=resume_cursor,
+                include_description=include_description
             )
             
-            # Save the cursor for future resumption
+            # Save the cursor for future resumption; reload first so the
+            # product tracking written during the fetch is not overwritten
             if last_cursor:
-                checkpoint["pagination_cursors"][period_name] = last_cursor
+                checkpoint = self._load_checkpoint()
+                checkpoint.setdefault("pagination_cursors", {})[period_name] = last_cursor
                 self._save_checkpoint(checkpoint)
-                print(f"Saved pagination cursor for {period_name} for precise resumption")
+                logger.info(f"Saved pagination cursor for {period_name} for precise resumption")
             
             # Deduplicate against global tracker
-            unique_products = []
-            for product in month_products:
-                product_key = (product.get('title', ''), product.get('url', ''))
-                if product_key not in self._global_product_keys:
-                    self._global_product_keys.add(product_key)
-                    unique_products.append(product)
-            
-            return unique_products
+            return self._register_unique(month_products)
             
         except (RateLimitExceeded, Exception) as e:
             # If we hit rate limits or other errors, switch to day-by-day chunking
-            print(f"⚠️ Error fetching month {period_name}: {str(e)}")
-            print(f"Switching to day-by-day fetching for {period_name}")
+            logger.warning(f"⚠️ Error fetching month {period_name}: {str(e)}")
+            logger.info(f"Switching to day-by-day fetching for {period_name}")
             
             # Get days in month
             days_in_month = (next_month_date - datetime(year, month, 1)).days
@@ -636,29 +886,30 @@ class ProductHuntScraper:
             daily_checkpoint_file = os.path.join(daily_checkpoint_dir, "daily_progress.json")
             if os.path.exists(daily_checkpoint_file):
                 try:
-                    with open(daily_checkpoint_file, "r") as f:
-                        daily_checkpoint = json.load(f)
-                except (json.JSONDecodeError, IOError):
+                    with open(daily_checkpoint_file, "rb") as f:
+                        daily_checkpoint = orjson.loads(f.read())
+                except (orjson.JSONDecodeError, IOError):
                     daily_checkpoint = {"completed_days": [], "pagination_cursors": {}}
             else:
                 daily_checkpoint = {"completed_days": [], "pagination_cursors": {}}
             
-            # Fetch day by day
+            # Fetch day by day; the daily checkpoint is written together with each day file
             month_products = []
+            partial_saved = 0  # month_products already written to the partial file
             for day in range(1, days_in_month + 1):
                 # Skip if already completed
                 if day in daily_checkpoint["completed_days"]:
-                    print(f"  Skipping already completed day {year_str}-{month_str}-{day:02d}")
+                    logger.info(f"  Skipping already completed day {year_str}-{month_str}-{day:02d}")
                     # Load products from saved file
                     day_filepath = os.path.join(daily_checkpoint_dir, f"day_{day:02d}.json")
                     if os.path.exists(day_filepath):
                         try:
-                            with open(day_filepath, "r") as f:
-                                day_products = json.load(f)
+                            with open(day_filepath, "rb") as f:
+                                day_products = orjson.loads(f.read())
                                 month_products.extend(day_products)
-                                print(f"  Loaded {len(day_products)} products from {day_filepath}")
-                        except (json.JSONDecodeError, IOError) as e:
-                            print(f"  Error loading day products: {e}")
+                                logger.info(f"  Loaded {len(day_products)} products from {day_filepath}")
+                        except (orjson.JSONDecodeError, IOError) as e:
+                            logger.error(f"  Error loading day products: {e}")
                     continue
                 
                 # Current day
@@ -668,10 +919,11 @@ class ProductHuntScraper:
                 day_period_name = f"{period_name}/{day:02d}"
                 
                 # Check for cursor to resume this specific day
-                day_cursor = daily_checkpoint.get("pagination_cursors", {}).get(day_period_name)
+                day_cursor = (daily_checkpoint.get("pagination_cursors", {}).get(day_period_name)
+                              or checkpoint.get("pagination_cursors", {}).get(day_period_name))
                 
                 try:
-                    print(f"Fetching products for {day_date}" + 
+                    logger.info(f"Fetching products for {day_date}" + 
                         (" resuming from saved position" if day_cursor else ""))
                         
                     day_products, last_cursor = self._fetch_products_for_period(
@@ -680,7 +932,8 @@ class ProductHuntScraper:
                         period_name=day_period_name,
                         save_path=daily_checkpoint_dir,
                         max_products=max_products,
-                        resume_cursor=day_cursor
+                        resume_cursor=day_cursor,
+                        include_description=include_description
                     )
                     
                     # Save cursor for future resumption
@@ -689,32 +942,50 @@ class ProductHuntScraper:
                             daily_checkpoint["pagination_cursors"] = {}
                         daily_checkpoint["pagination_cursors"][day_period_name] = last_cursor
                     
-                    # Save this day's products
+                    # Save this day's products. A re-fetched day comes back short (or empty) because its
+                    # products are already marked seen, so merge into the saved file rather than replace it
                     day_filepath = os.path.join(daily_checkpoint_dir, f"day_{day:02d}.json")
-                    with open(day_filepath, "w") as f:
-                        json.dump(day_products, f, indent=2)
+                    saved_day_products = []
+                    try:
+                        with open(day_filepath, "rb") as f:
+                            saved_day_products = orjson.loads(f.read())
+                    except FileNotFoundError:
+                        pass
+                    except (orjson.JSONDecodeError, IOError) as e:
+                        logger.error(f"  Error loading day products: {e}")
+                    saved_keys = {_product_key(product) for product in saved_day_products}
+                    day_products = saved_day_products + [
+                        product for product in day_products if _product_key(product) not in saved_keys
+                    ]
+                    if len(day_products) > len(saved_day_products) or not os.path.exists(day_filepath):
+                        _atomic_write_json(day_filepath, day_products)
                     
                     # Update daily checkpoint
                     daily_checkpoint["completed_days"].append(day)
-                    with open(daily_checkpoint_file, "w") as f:
-                        json.dump(daily_checkpoint, f, indent=2)
+                    _atomic_write_json(daily_checkpoint_file, daily_checkpoint)
                     
                     # Add to month products
                     month_products.extend(day_products)
                     
                     # Add significant delay between days
                     if day < days_in_month:
-                        print(f"  Waiting between days to respect rate limits...")
-                        time.sleep(30)  # 30 seconds between days
+                        logger.info("  Waiting between days to respect rate limits...")
+                        time.sleep(self.adaptive_delay * 4)
                         
                 except Exception as e:
-                    print(f"⚠️ Error fetching day {day_date}: {str(e)}")
-                    # Save monthly progress so far
-                    if save_path and month_products:
-                        month_filepath = os.path.join(save_path, f"{period_name.replace('/', '_')}_partial.json")
-                        with open(month_filepath, "w", encoding="utf-8") as f:
-                            json.dump(month_products, f, indent=2)
-                        print(f"  Saved partial {len(month_products)} products for {period_name}")
+                    logger.warning(f"⚠️ Error fetching day {day_date}: {str(e)}")
+                    
+                    # Save monthly progress so far as JSON Lines, appending only
+                    # the products gathered since the previous partial save
+                    if save_path and len(month_products) > partial_saved:
+                        month_filepath = os.path.join(save_path, f"{period_name.replace('/', '_')}_partial.jsonl")
+                        with open(month_filepath, "ab" if partial_saved else "wb") as f:
+                            f.writelines(
+                                orjson.dumps(product, option=orjson.OPT_APPEND_NEWLINE)
+                                for product in month_products[partial_saved:]
+                            )
+                        partial_saved = len(month_products)
+                        logger.info(f"  Saved partial {len(month_products)} products for {period_name}")
                     
                     # If fatal error, re-raise
                     if isinstance(e, KeyboardInterrupt):
@@ -723,130 +994,177 @@ class ProductHuntScraper:
                     # Otherwise add delay and continue with next day
                     time.sleep(60)  # 1 minute delay after error
             
-            # Initialize global deduplication tracker if it doesn't exist
-            if not hasattr(self, '_global_product_keys'):
-                self._global_product_keys = set()
-
             # Deduplicate against global tracker
-            unique_products = []
-            for product in month_products:
-                product_key = (product.get('title', ''), product.get('url', ''))
-                if product_key not in self._global_product_keys:
-                    self._global_product_keys.add(product_key)
-                    unique_products.append(product)
+            unique_products = self._register_unique(month_products)
 
             # Save unique products if requested
             if save_path and unique_products:
                 month_filepath = os.path.join(save_path, f"{period_name.replace('/', '_')}.json")
-                with open(month_filepath, "w", encoding="utf-8") as f:
-                    json.dump(unique_products, f, indent=2)
-                print(f"  Saved {len(unique_products)} unique products for {period_name}")
+                _atomic_write_json(month_filepath, unique_products)
+                self._period_keys.pop(month_filepath, None)  # the cached keys describe the old file
+                logger.info(f"  Saved {len(unique_products)} unique products for {period_name}")
 
             return unique_products
         
 
+    def _register_unique(self, products: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Return the products not seen before this session, recording their keys."""
+        seen = self._global_product_keys
+        unique_products = []
+        for product in products:
+            product_key = _product_key(product)
+            if product_key not in seen:
+                seen.add(product_key)
+                unique_products.append(product)
+        return unique_products
+
     def _append_to_period_file(self, period_name: str, products: List[Dict[str, Any]], save_path: str) -> None:
         """Append products to a period-specific file without overwriting existing content."""
         period_filepath = os.path.join(save_path, f"{period_name.replace('/', '_')}.json")
         
-        # Check if file exists and load existing data
         existing_products = []
-        if os.path.exists(period_filepath):
-            try:
-                with open(period_filepath, "r", encoding="utf-8") as f:
-                    existing_products = json.load(f)
-                    print(f"  Loaded {len(existing_products)} existing products from {period_filepath}")
-            except (json.JSONDecodeError, IOError) as e:
-                print(f"  Error loading existing products from {period_filepath}: {e}")
-                # If we can't load it, create a backup
-                if os.path.getsize(period_filepath) > 0:
-                    backup_path = f"{period_filepath}.bak"
-                    try:
-                        import shutil
-                        shutil.copy2(period_filepath, backup_path)
-                        print(f"  Created backup of corrupted file at {backup_path}")
-                    except Exception as backup_error:
-                        print(f"  Failed to create backup: {backup_error}")
+        try:
+            with open(period_filepath, "rb") as f:
+                existing_products = orjson.loads(f.read())
+                logger.info(f"  Loaded {len(existing_products)} existing products from {period_filepath}")
+        except FileNotFoundError:
+            self._period_keys.pop(period_filepath, None)
+        except (orjson.JSONDecodeError, IOError) as e:
+            logger.error(f"  Error loading existing products from {period_filepath}: {e}")
+            self._period_keys.pop(period_filepath, None)
         
-        # Merge new products with existing ones
-        # Create a set of existing product identifiers to avoid duplicates
-        existing_ids = set()
-        for product in existing_products:
-            # Create a unique identifier based on title and URL
-            product_id = (product.get("title", ""), product.get("url", ""))
-            existing_ids.add(product_id)
+        # Build the file's dedup keys only on first touch this session
+        keys = self._period_keys.get(period_filepath)
+        if keys is None:
+            keys = self._period_keys[period_filepath] = {_product_key(product) for product in existing_products}
         
         # Only add products that don't already exist
         new_added = 0
         for product in products:
-            product_id = (product.get("title", ""), product.get("url", ""))
-            if product_id not in existing_ids:
+            product_id = _product_key(product)
+            if product_id not in keys:
+                keys.add(product_id)
                 existing_products.append(product)
-                existing_ids.add(product_id)
                 new_added += 1
         
-        # Write the merged list back to the file
-        with open(period_filepath, "w", encoding="utf-8") as f:
-            json.dump(existing_products, f, indent=2)
+        # Write the merged list back to the file; if that fails the keys no longer match it
+        try:
+            _atomic_write_json(period_filepath, existing_products)
+        except Exception:
+            self._period_keys.pop(period_filepath, None)
+            raise
         
-        print(f"  Added {new_added} new products to {period_filepath} (total: {len(existing_products)})")
+        logger.info(f"  Added {new_added} new products to {period_filepath} (total: {len(existing_products)})")
+
+    def _year_file(self, year: str) -> str:
+        """Path of the per-year product file for year."""
+        return os.path.join(self.global_save_path, f"producthunt_{year}.json.gz")
+
+    def _load_combined_data(self, save_path: str) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Load the legacy combined file, then overlay the per-year files written since.
+        A year file older than the combined file is skipped for the years the combined file has,
+        so a combined file regenerated by hand is not shadowed by stale year files.
+        Sorting puts a year's .json.gz after any plain .json left by older runs, so the compressed file wins.
+        """
+        combined_file = os.path.join(save_path, COMBINED_FILENAME)
+        existing_data = {}
+        combined_mtime = 0.0
+        try:
+            with open(combined_file, "rb") as f:
+                combined_mtime = os.fstat(f.fileno()).st_mtime
+                existing_data = orjson.loads(f.read())
+                logger.info(f"Loaded existing data from {combined_file}")
+        except FileNotFoundError:
+            pass
+        except (orjson.JSONDecodeError, IOError) as e:
+            logger.error(f"Error loading existing data: {e}")
+        
+        for filename in sorted(os.listdir(save_path)):
+            match = YEAR_FILE_RE.match(filename)
+            if not match:
+                continue
+            year_file = os.path.join(save_path, filename)
+            if match.group(1) in existing_data and os.path.getmtime(year_file) < combined_mtime:
+                continue
+            opener = gzip.open if match.group(2) else open
+            try:
+                with opener(year_file, "rb") as f:
+                    existing_data[match.group(1)] = orjson.loads(f.read())
+            except (orjson.JSONDecodeError, IOError, EOFError) as e:
+                logger.error(f"Error loading {year_file}: {e}")
+        return existing_data
+
+    def _use_combined_data(self, existing_data: Dict[str, List[Dict[str, Any]]]) -> None:
+        """Adopt already-parsed combined-file data as the in-memory mirror and index its keys."""
+        self._combined_data = existing_data
+        self._combined_keys_by_year = {
+            year: {_product_key(product) for product in products}
+            for year, products in existing_data.items()
+        }
 
     def _append_to_combined_file(self, flush: bool = False) -> None:
-        """Append products to the combined file without overwriting existing content."""
+        """
+        Merge new products into the combined data and rewrite only the per-year files that changed.
+        The legacy single combined file is rewritten by _write_combined_file after each year.
+        """
         if not self.global_save_path:
             return
         
-        combined_file = os.path.join(self.global_save_path, "producthunt_all_years.json")
+        # Load existing data and index its keys only on the first call of a run
+        if self._combined_data is None:
+            self._use_combined_data(self._load_combined_data(self.global_save_path))
+        existing_data = self._combined_data
         
-        # Check if the file exists and load existing data
-        existing_data = {}
-        if os.path.exists(combined_file):
-            try:
-                with open(combined_file, "r", encoding="utf-8") as f:
-                    existing_data = json.load(f)
-                    if flush:
-                        print(f"⚡ Loaded existing data from {combined_file} for update")
-            except (json.JSONDecodeError, IOError) as e:
-                print(f"Error loading existing combined data: {e}")
-                # If we can't load it, create a backup
-                if os.path.getsize(combined_file) > 0:
-                    backup_path = f"{combined_file}.bak"
-                    try:
-                        import shutil
-                        shutil.copy2(combined_file, backup_path)
-                        print(f"Created backup of corrupted file at {backup_path}")
-                    except Exception as backup_error:
-                        print(f"Failed to create backup: {backup_error}")
-        
-        # Merge new products with existing ones
+        # Merge only the products that arrived since the previous call
         products_added = 0
+        changed_years = []
         for year, products in self.all_products.items():
-            # Get existing products for this year
-            existing_year_products = existing_data.get(year, [])
+            start = self._combined_synced.get(year, 0)
+            if start == len(products):
+                continue
             
-            # Create a set of existing product identifiers
-            existing_ids = set()
-            for product in existing_year_products:
-                product_id = (product.get("title", ""), product.get("url", ""))
-                existing_ids.add(product_id)
+            existing_year_products = existing_data.setdefault(year, [])
+            existing_ids = self._combined_keys_by_year.setdefault(year, set())
             
             # Add only new products
-            for product in products:
-                product_id = (product.get("title", ""), product.get("url", ""))
+            added_before = products_added
+            for product in products[start:]:
+                product_id = _product_key(product)
                 if product_id not in existing_ids:
                     existing_year_products.append(product)
                     existing_ids.add(product_id)
                     products_added += 1
             
-            # Update the existing data
-            existing_data[year] = existing_year_products
+            self._combined_synced[year] = len(products)
+            if products_added > added_before:
+                changed_years.append(year)
         
-        # Write the merged data back to the file
-        with open(combined_file, "w", encoding="utf-8") as f:
-            json.dump(existing_data, f, indent=2)
+        # Rewrite only the years that received new products
+        # (hand the writer a snapshot, the live list keeps growing)
+        # Years whose previous write failed are written again from the in-memory data
+        for year in self._check_writes():
+            if year not in changed_years:
+                changed_years.append(year)
+        for year in changed_years:
+            self._pending_writes.append(
+                (year, self._io_pool.submit(_atomic_write_json, self._year_file(year), list(existing_data[year])))
+            )
         
         if flush:
-            print(f"⚡ Flushed {products_added} new items to {combined_file}")
+            logger.info(f"⚡ Flushed {products_added} new items to {len(changed_years)} year file(s)")
+
+    def _write_combined_file(self) -> str:
+        """
+        Stitch the in-memory per-year data into the legacy combined file and return its path.
+        Queued year writes are waited for (so the combined file is the newest) but their failures
+        are left pending, for the next flush to log and retry or for close() to raise.
+        """
+        combined_file = os.path.join(self.global_save_path, COMBINED_FILENAME)
+        wait([future for _, future in self._pending_writes])
+        if self._combined_data is not None:
+            _atomic_write_json(combined_file, self._combined_data)
+        return combined_file
 
 
     def get_products_by_year_range(
@@ -854,7 +1172,8 @@ class ProductHuntScraper:
         start_year: int = 2020,
         end_year: Optional[int] = None,
         save_path: Optional[str] = None,
-        max_per_month: Optional[int] = None
+        max_per_month: Optional[int] = None,
+        include_description: bool = True
     ) -> Dict[str, List[Dict[str, Any]]]:
         """
         Fetch products from Product Hunt for a range of years.
@@ -874,21 +1193,21 @@ class ProductHuntScraper:
         self.global_save_path = save_path
         self.all_products = {}
         self.items_since_flush = 0
+        self._combined_data = None
+        self._combined_keys_by_year = {}
+        self._combined_synced = {}
+        self._period_keys = {}
         
         # Before starting, load existing data to avoid duplicates
         if save_path:
-            combined_file = os.path.join(save_path, "producthunt_all_years.json")
-            if os.path.exists(combined_file):
-                try:
-                    with open(combined_file, "r", encoding="utf-8") as f:
-                        existing_data = json.load(f)
-                        print(f"Loaded existing data from {combined_file}")
-                        # Pre-populate all_products with existing data to enable deduplication
-                        for year, products in existing_data.items():
-                            self.all_products[year] = products.copy()
-                        print(f"Pre-loaded {sum(len(products) for products in self.all_products.values())} products from {len(self.all_products)} years")
-                except (json.JSONDecodeError, IOError) as e:
-                    print(f"Error loading existing data: {e}")
+            existing_data = self._load_combined_data(save_path)
+            # Pre-populate all_products with existing data to enable deduplication
+            for year, products in existing_data.items():
+                self.all_products[year] = products.copy()
+            if existing_data:
+                logger.info(f"Pre-loaded {sum(len(products) for products in self.all_products.values())} products from {len(self.all_products)} years")
+            # Hand the parsed data to the first combined-file flush so it isn't parsed twice
+            self._use_combined_data(existing_data)
 
         # Load checkpoint state
         checkpoint = self._load_checkpoint()
@@ -900,7 +1219,7 @@ class ProductHuntScraper:
         # Iterate through each year
         for year in range(start_year, end_year + 1):
             year_str = str(year)
-            print(f"\n==== Fetching products for {year_str} ====")
+            logger.info(f"==== Fetching products for {year_str} ====")
 
             # Determine which month to start at (resume support)
             start_month = 1
@@ -911,22 +1230,23 @@ class ProductHuntScraper:
             for month in range(start_month, 13):
                 # Skip future months
                 if year == today.year and month > today.month:
-                    print(f"Skipping future month {year}-{month:02d}")
+                    logger.info(f"Skipping future month {year}-{month:02d}")
                     break
 
                 month_key = f"{year}_{month:02d}"
                 # Skip already checkpointed months
                 if month_key in checkpoint["completed_periods"]:
-                    print(f"Skipping already completed month {year}-{month:02d}")
+                    logger.info(f"Skipping already completed month {year}-{month:02d}")
                     continue
 
                 try:
-                    print(f"\n--- Fetching products for {year_str}-{month:02d} ---")
+                    logger.info(f"--- Fetching products for {year_str}-{month:02d} ---")
                     month_products = self._fetch_products_for_month(
                         year=year,
                         month=month,
                         save_path=save_path,            # Enable per-month file saving with append
-                        max_products=max_per_month
+                        max_products=max_per_month,
+                        include_description=include_description
                     )
                     
                     # Update checkpoint
@@ -941,42 +1261,55 @@ class ProductHuntScraper:
                     # Append to combined data after each month completes
                     if save_path:
                         self._append_to_combined_file(flush=True)
-                        print(f"Combined data updated with latest products from {year}-{month:02d}")
+                        logger.info(f"Combined data updated with latest products from {year}-{month:02d}")
 
                     # Wait between months to respect rate limits
                     if month < 12:
-                        print(f"\nWaiting between months to respect rate limits...")
-                        time.sleep(15)
+                        logger.info("Waiting between months to respect rate limits...")
+                        time.sleep(self.adaptive_delay * 2)
 
                 except KeyboardInterrupt:
+                    # Keep the legacy combined file in step with the per-year files
+                    if save_path:
+                        self._write_combined_file()
                     raise
                 except Exception as e:
-                    print(f"⚠️ Error processing month {year}-{month:02d}: {str(e)}")
+                    logger.warning(f"⚠️ Error processing month {year}-{month:02d}: {str(e)}")
                     time.sleep(20)  # pause then continue
 
+            # Keep the legacy combined file, which downstream consumers read, current after each year
+            if save_path:
+                try:
+                    self._append_to_combined_file()
+                    self._write_combined_file()
+                except Exception as e:
+                    logger.warning(f"⚠️ Error updating combined data after {year_str}: {str(e)}")
+
             # Wait between years
             if year < end_year:
-                print(f"\nWaiting before fetching next year...")
+                logger.info("Waiting before fetching next year...")
                 time.sleep(20)
 
         # Once all years are done, ensure all data is saved
+        # (the last year's pass already flushed everything and rewrote the combined file)
         if save_path:
-            self._append_to_combined_file(flush=True)
-            
-            # Load the final combined data to return
-            combined_file = os.path.join(save_path, "producthunt_all_years.json")
-            with open(combined_file, "r", encoding="utf-8") as f:
-                all_products = json.load(f)
+            combined_file = os.path.join(save_path, COMBINED_FILENAME)
+            all_products = self._combined_data
             
             total_count = sum(len(v) for v in all_products.values())
-            print(f"✅ All years saved to {combined_file} ({total_count} total items)")
+            logger.info(f"✅ All years saved to {combined_file} ({total_count} total items)")
             return all_products
         else:
             # If no save path, return the in-memory data
             return self.all_products
 
 
-    def get_latest_products(self, limit: int = 100, save_path: Optional[str] = None) -> List[Dict[str, Any]]:
+    def get_latest_products(
+        self,
+        limit: int = 100,
+        save_path: Optional[str] = None,
+        include_description: bool = True
+    ) -> List[Dict[str, Any]]:
         """
         Fetch the latest products from Product Hunt.
         This is a convenience method that's faster than retrieving by year when you just want recent products.
@@ -984,34 +1317,14 @@ class ProductHuntScraper:
         Args:
             limit: Maximum number of products to return
             save_path: Optional path to save results
+            include_description: Also request the (often multi-KB) description field
             
         Returns:
             List of product dictionaries
         """
-        print(f"Fetching latest {limit} products...")
+        logger.info(f"Fetching latest {limit} products...")
         
-        # GraphQL query for latest products
-        query = """
-        query GetLatestProducts($first: Int!, $after: String) {
-        posts(first: $first, after: $after, order: NEWEST) {
-            pageInfo {
-            hasNextPage
-            endCursor
-            }
-            edges {
-            node {
-                name
-                tagline
-                description
-                website
-                thumbnail {
-                url
-                }
-            }
-            }
-        }
-        }
-        """
+        query = self._build_query(QUERY_LATEST_POSTS, include_description)
         
         result = []
         cursor = None
@@ -1026,34 +1339,15 @@ class ProductHuntScraper:
             if cursor:
                 variables["after"] = cursor
             
-            print(f"  Fetching page {page}...")
+            logger.debug(f"  Fetching page {page}...")
             
             try:
-                resp = requests.post(
-                    self.api_url,
-                    json={"query": query, "variables": variables},
-                    headers=self.headers,
-                    timeout=15
-                )
-                
-                # Handle rate limiting
-                if resp.status_code == 429:
-                    self.retry_count += 1
-                    if self.retry_count <= self.max_retries:
-                        backoff_time = min(300, 2 ** self.retry_count)
-                        print(f"⚠️ Rate limited (429). Backing off for {backoff_time} seconds...")
-                        time.sleep(backoff_time)
-                        continue  # Retry the request
-                    else:
-                        print(f"⛔ Maximum retries reached for latest products, page {page}")
-                        break
-                
-                # Handle other errors
-                resp.raise_for_status()
-                data = resp.json()
+                data = self._post_graphql(query, variables)
+                if data is None:
+                    continue  # backed off after a 429, retry the same page
                 
                 if errors := data.get("errors"):
-                    print(f"⚠️ GraphQL errors for latest products, page {page}: {errors}")
+                    logger.warning(f"⚠️ GraphQL errors for latest products, page {page}: {errors}")
                     break
                 
                 posts_data = data.get("data", {}).get("posts", {})
@@ -1062,30 +1356,13 @@ class ProductHuntScraper:
                 
                 # Check if we got any products
                 if not edges:
-                    print(f"  No products found for latest products, page {page}")
+                    logger.info(f"  No products found for latest products, page {page}")
                     break
                 
-                # Reset retry count on successful response
-                if self.retry_count > 0:
-                    self.retry_count = max(0, self.retry_count - 1)
-                
-                # Process products on this page
-                for edge in edges:
-                    node = edge["node"]
-                    
-                    # Create product with simplified field names
-                    product = {
-                        "title": node["name"],
-                        "blurb": node.get("tagline", ""),
-                        "description": node.get("description", ""),
-                        "url": node.get("website", ""),
-                        "profile_picture": node.get("thumbnail", {}).get("url", ""),
-                        "source": "producthunt"
-                    }
-                    
-                    result.append(product)
+                # Process products on this page with simplified field names
+                result.extend(_node_to_product(edge["node"]) for edge in edges)
                 
-                print(f"  Fetched page {page}, total products so far: {len(result)}")
+                logger.debug(f"  Fetched page {page}, total products so far: {len(result)}")
                 
                 # Check if we can get more
                 if not page_info.get("hasNextPage", False) or not page_info.get("endCursor"):
@@ -1094,20 +1371,16 @@ class ProductHuntScraper:
                 cursor = page_info.get("endCursor")
                 page += 1
                 
-                # Add a delay between pages
-                time.sleep(2)
-                
             except Exception as e:
-                print(f"⚠️ Error fetching latest products, page {page}: {str(e)}")
+                logger.warning(f"⚠️ Error fetching latest products, page {page}: {str(e)}")
                 break
         
         # Save if requested
         if save_path and result:
             os.makedirs(save_path, exist_ok=True)
             filepath = os.path.join(save_path, "producthunt_latest.json")
-            with open(filepath, "w", encoding="utf-8") as f:
-                json.dump(result, f, indent=2)
-            print(f"Saved {len(result)} latest products")
+            _atomic_write_json(filepath, result)
+            logger.info(f"Saved {len(result)} latest products")
         
         return result
 
@@ -1123,8 +1396,15 @@ if __name__ == "__main__":
     parser.add_argument("--save-path", type=str, default="data", help="Path to save data (default: 'data')")
     parser.add_argument("--latest", type=int, default=None, help="Fetch only latest N products instead of by year range")
     parser.add_argument("--delay", type=float, default=2.0, help="Base delay between requests (default: 2.0)")
+    parser.add_argument("--no-description", action="store_true", help="Skip the long description field to shrink responses")
+    parser.add_argument("--verbose", action="store_true", help="Also log per-page progress")
     args = parser.parse_args()
     
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.INFO,
+        format="%(asctime)s - %(levelname)s - %(message)s"
+    )
+    
     print("====================================")
     print("PRODUCT HUNT COMPLETE DATA SCRAPER")
     print("====================================")
@@ -1139,7 +1419,8 @@ if __name__ == "__main__":
             print(f"Fetching latest {args.latest} products...")
             products = scraper.get_latest_products(
                 limit=args.latest,
-                save_path=args.save_path
+                save_path=args.save_path,
+                include_description=not args.no_description
             )
             print(f"Fetched {len(products)} latest products")
         else:
@@ -1157,7 +1438,8 @@ if __name__ == "__main__":
                 start_year=args.start_year,
                 end_year=args.end_year,
                 save_path=args.save_path,
-                max_per_month=args.max_per_month
+                max_per_month=args.max_per_month,
+                include_description=not args.no_description
             )
             
             # Print summary of results
@@ -1184,4 +1466,7 @@ if __name__ == "__main__":
         traceback.print_exc()
         print("\nProgress has been saved. You can resume later by running the script again.\n")
     
+    finally:
+        scraper.close()
+    
     print("====================================")
\ No newline at end of file
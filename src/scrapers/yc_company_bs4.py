@@ -1,17 +1,76 @@
-import json
 import re
+import orjson
 import time
+import threading
 import requests
-from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
+
+# lxml's C parser is much faster; fall back to the stdlib parser where it isn't installed
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# Only the tags scrape_company reads from (plus their children) are kept in the tree
+ONLY_FIELDS = SoupStrainer(['div', 'img', 'h1'])
+
+# Exact class attribute of each div scrape_company reads -> field it holds
+CLASS_TO_FIELD = {
+    'h-32 w-32 shrink-0 rounded-xl': 'pic_div',
+    'flex items-center gap-x-3': 'title_div',
+    'prose hidden max-w-full md:block': 'blurb_div',
+    'prose max-w-full whitespace-pre-line': 'desc_div',
+}
+
+# Pulls the image URL out of an inline "background-image: url(...)" style
+_STYLE_URL_RE = re.compile(r'url\(([^)]+)\)')
+
+MAX_WORKERS = 16
+REQUESTS_PER_SECOND = 2.0  # aggregate across all workers, be polite!
+REQUEST_TIMEOUT = 10  # seconds
+
+class RateLimiter:
+    """Token bucket shared by all worker threads."""
+    def __init__(self, rate, capacity=1):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+                self.last = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
 
 def scrape_company(url, session):
     # Fetch via GET (not POST)
-    resp = session.get(url)
+    resp = session.get(url, timeout=REQUEST_TIMEOUT)
     resp.raise_for_status()
-    soup = BeautifulSoup(resp.text, 'html.parser')
+    soup = BeautifulSoup(resp.content, HTML_PARSER, parse_only=ONLY_FIELDS)
+
+    # Find all four field containers in a single pass over the divs
+    found = {}
+    for div in soup.find_all('div'):
+        field = CLASS_TO_FIELD.get(' '.join(div.get('class', ())))
+        if field and field not in found:
+            found[field] = div
+            if len(found) == len(CLASS_TO_FIELD):
+                break
 
     # 1. profile picture (logo)
-    pic_div = soup.find('div', class_='h-32 w-32 shrink-0 rounded-xl')
+    pic_div = found.get('pic_div')
     pic_url = None
     if pic_div:
         img = pic_div.find('img')
@@ -19,24 +78,24 @@ def scrape_company(url, session):
             pic_url = img['src']
         else:
             style = pic_div.get('style', '')
-            m = re.search(r'url\(([^)]+)\)', style)
+            m = _STYLE_URL_RE.search(style)
             if m:
                 pic_url = m.group(1).strip('"\'')
     
     # 2. title
-    title_div = soup.find('div', class_='flex items-center gap-x-3')
+    title_div = found.get('title_div')
     title = None
     if title_div:
         h1 = title_div.find('h1')
         title = h1.get_text(strip=True) if h1 else title_div.get_text(strip=True)
     
-    # 3. blurb
-    blurb_div = soup.find('div', class_='prose hidden max-w-full md:block')
-    blurb = blurb_div.get_text(strip=True) if blurb_div else None
+    # 3. blurb (text nodes joined with spaces so words in separate tags don't run together)
+    blurb_div = found.get('blurb_div')
+    blurb = blurb_div.get_text(' ', strip=True) if blurb_div else None
 
     # 4. full description
-    desc_div = soup.find('div', class_='prose max-w-full whitespace-pre-line')
-    description = desc_div.get_text(strip=True) if desc_div else None
+    desc_div = found.get('desc_div')
+    description = desc_div.get_text(' ', strip=True) if desc_div else None
 
     return {
         'url': url,
@@ -48,33 +107,48 @@ def scrape_company(url, session):
 
 def main():
     # Load your list of company URLs
-    with open('data/company_urls.json', 'r') as f:
-        urls = json.load(f)
+    with open('data/company_urls.json', 'rb') as f:
+        urls = orjson.loads(f.read())
 
     session = requests.Session()
     session.headers.update({
         'User-Agent': 'Mozilla/5.0 (compatible; your-scraper/1.0)'
     })
+    retry = Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+    adapter = HTTPAdapter(pool_connections=MAX_WORKERS, pool_maxsize=2 * MAX_WORKERS, max_retries=retry)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    limiter = RateLimiter(REQUESTS_PER_SECOND)
+
+    def fetch(url):
+        limiter.acquire()
+        return scrape_company(url, session)
 
     results = []
     total = len(urls)
-    for i, url in enumerate(urls, 1):
-        try:
-            data = scrape_company(url, session)
-            results.append(data)
-            print(f"[{i}/{total}] scraped: {data['title']}")
-        except requests.exceptions.HTTPError as e:
-            if e.response.status_code == 404:
-                print(f"[{i}/{total}] SKIP (404): {url}")
-            else:
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as ex:
+        futures = {ex.submit(fetch, url): url for url in urls}
+        for i, future in enumerate(as_completed(futures), 1):
+            url = futures[future]
+            try:
+                data = future.result()
+                results.append(data)
+                print(f"[{i}/{total}] scraped: {data['title']}")
+            except requests.exceptions.HTTPError as e:
+                if e.response.status_code == 404:
+                    print(f"[{i}/{total}] SKIP (404): {url}")
+                else:
+                    print(f"[{i}/{total}] ERROR scraping {url}: {e}")
+            except Exception as e:
                 print(f"[{i}/{total}] ERROR scraping {url}: {e}")
-        except Exception as e:
-            print(f"[{i}/{total}] ERROR scraping {url}: {e}")
-        time.sleep(0.5)  # be polite!
+
+    # Keep the output in the same order as the input URL list
+    order = {url: i for i, url in enumerate(urls)}
+    results.sort(key=lambda d: order[d['url']])
 
     # Save to company_details.json
-    with open('data/company_details.json', 'w') as f:
-        json.dump(results, f, indent=2, ensure_ascii=False)
+    with open('data/company_details.json', 'wb') as f:
+        f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
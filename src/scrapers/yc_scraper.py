@@ -1,20 +1,37 @@
 import os
+import re
 import time
 import json
 import random
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
 import traceback
+from functools import lru_cache
 from logging.handlers import RotatingFileHandler
 from queue import Queue, Empty
-from threading import Thread, Lock
-from typing import Set, Dict, Any, Optional, List
+from threading import Thread, Lock, Event
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Set, Dict, Any, Optional, List, Tuple
+from urllib.parse import urlencode
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from webdriver_manager.chrome import ChromeDriverManager
+try:
+    import fcntl
+except ImportError:  # Windows: cache slots are only coordinated within this process
+    fcntl = None
+try:
+    from .yc_company_bs4 import RateLimiter, REQUESTS_PER_SECOND, scrape_company
+except ImportError:  # run as a script from this directory
+    from yc_company_bs4 import RateLimiter, REQUESTS_PER_SECOND, scrape_company
 
 # ----------------------
 # Configuration
@@ -34,11 +51,37 @@ USER_AGENTS = [
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 Version/15.0 Safari/605.1.15",
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 Chrome/93.0.4577.63 Safari/537.36",
 ]
-IMPLICIT_WAIT = 5
-SCROLL_PAUSE = 1.5
+# Requests the browser never makes: images (logos are read from the src attribute,
+# not the bitmap), web fonts and analytics. Stylesheets stay, the scroll loader needs layout.
+# Extensions are anchored to the end of the path (optionally followed by a query) so that
+# scripts or XHRs whose URL merely contains e.g. ".icons/" are never blocked.
+BLOCKED_EXTENSIONS = ("png", "jpg", "jpeg", "gif", "webp", "svg", "ico", "woff", "woff2", "ttf", "otf")
+BLOCKED_URL_PATTERNS = [pattern for ext in BLOCKED_EXTENSIONS for pattern in (f"*.{ext}", f"*.{ext}?*")] + [
+    "*google-analytics.com*", "*googletagmanager.com*", "*cdn.segment.com*", "*api.segment.io*",
+]
+# Stylesheets stay enabled: 'Show more' clickability and infinite scroll depend on layout
+CHROME_PREFS = {
+    "profile.managed_default_content_settings.images": 2,
+    "profile.managed_default_content_settings.fonts": 2,
+}
+IMPLICIT_WAIT = 0  # page readiness is awaited explicitly; optional-field lookups must not block
+IDLE_QUIET = 0.3        # network counts as idle once no new resource has loaded for this long
+IDLE_TIMEOUT = 2.0      # ...or after this long, whichever comes first
+IDLE_POLL = 0.1
 MAX_SCROLLS = 200       # Reduced for each batch since they're smaller
 MAX_STAGNANT_SCROLLS = 10  # Fewer scrolls before giving up on a batch
 CHECKPOINT_INTERVAL = 50
+GONE_STATUSES = (404, 410)  # company pages YC has taken down
+URLS_SAVE_THRESHOLD = 1000  # new URLs before company_urls.json is rewritten mid-run
+JSONL_BUFFER_SIZE = 1 << 20  # records are flushed to disk with every checkpoint
+
+# The directory page is backed by a public Algolia index; querying it directly
+# returns a whole batch in one or two JSON calls instead of hundreds of scrolls
+ALGOLIA_URL = "https://45bwzj1sgc-dsn.algolia.net/1/indexes/*/queries"
+ALGOLIA_INDEX = "YCCompany_production"
+ALGOLIA_HITS_PER_PAGE = 1000
+# Search-only credentials are embedded in the directory page as window.AlgoliaOpts
+ALGOLIA_OPTS_RE = re.compile(r'AlgoliaOpts\s*=\s*(\{.*?\})')
 
 data_dir = "data"
 urls_file = os.path.join(data_dir, "company_urls.json")
@@ -47,6 +90,87 @@ checkpoint_file = os.path.join(data_dir, "checkpoint.json")
 jsonl_file = os.path.join(data_dir, "yc_companies.jsonl")
 json_file = os.path.join(data_dir, "yc_companies.json")
 log_file = "yc_scraper.log"
+batch_debug_dir = os.path.join(data_dir, "debug", "batches")
+company_debug_dir = os.path.join(data_dir, "debug", "companies")
+# Chrome's disk cache persists site JS/CSS across runs. A cache directory cannot be
+# shared by running browsers, so each browser claims a numbered slot (<n>/ plus a
+# locked <n>.lock) and hands it back when it quits; the lowest free slot is reused.
+chrome_cache_dir = os.path.join(data_dir, "chrome_cache")
+CHROME_CACHE_SIZE = 100 * 1024 * 1024
+
+# Raw hrefs of company anchors not returned by an earlier call on this page,
+# fetched in one WebDriver round trip (window.__seen resets on navigation)
+COLLECT_LINKS_JS = """
+    const seen = window.__seen || (window.__seen = new Set());
+    const out = [];
+    for (const a of document.querySelectorAll('a[href*="/companies/"]')) {
+        const href = a.getAttribute('href');
+        if (href && !seen.has(href)) { seen.add(href); out.push(href); }
+    }
+    return out;
+"""
+
+# Number of resources fetched so far; the buffer is enlarged first so the count keeps growing past 250
+RESOURCE_COUNT_JS = """
+    if (!window.__bufferRaised) { performance.setResourceTimingBufferSize(100000); window.__bufferRaised = true; }
+    return performance.getEntriesByType('resource').length;
+"""
+
+# Company detail fields, each trying its selectors in order (same fallbacks as the
+# old per-selector lookups), returned as one object: {name, blurb, description, logo, batch}
+EXTRACT_DETAIL_JS = r"""
+    const text = el => ((el && (el.innerText || el.textContent)) || '').trim();
+    const firstText = sels => {
+        for (const sel of sels) {
+            for (const el of document.querySelectorAll(sel)) {
+                const t = text(el);
+                if (t) return t;
+            }
+        }
+        return '';
+    };
+    const IMAGE_EXT = /\.(png|jpe?g|svg|webp)(\?|$)/i;  // CDN logo URLs often carry a query string
+    const isImage = src => IMAGE_EXT.test(src || '');
+    const out = {name: '', blurb: '', description: '', logo: '', batch: ''};
+    try {
+        out.name = text(document.querySelector('h1'));
+
+        out.blurb = firstText([
+            '.prose.hidden.max-w-full.md\\:block',
+            '.prose.hidden.max-w-full',
+            'div.prose.hidden',
+            '.tagline',
+            "[data-component='CompanyTagline']"
+        ]);
+        if (!out.blurb) {
+            for (const el of document.querySelectorAll('.prose.hidden')) {
+                const t = el.textContent.trim();
+                if (t) { out.blurb = t; break; }
+            }
+        }
+        if (!out.blurb) {
+            // Fallback to short paragraphs that could be taglines
+            for (const p of document.querySelectorAll('p, h2, h3')) {
+                const t = p.textContent.trim();
+                if (t.length > 10 && t.length < 200) { out.blurb = t; break; }
+            }
+        }
+
+        for (const sel of ['.prose.max-w-full.whitespace-pre-line', 'div.prose.max-w-full', '.company-description']) {
+            const texts = Array.from(document.querySelectorAll(sel), text).filter(Boolean);
+            if (texts.length) { out.description = texts.join(' '); break; }
+        }
+
+        for (const sel of ['.company-logo img', "[data-component='CompanyLogo'] img", 'img[alt*=logo]', 'header img', '.logo img', 'img']) {
+            const img = Array.from(document.querySelectorAll(sel)).find(i => isImage(i.src));
+            if (img) { out.logo = img.src; break; }
+        }
+
+        out.batch = text(document.querySelector('.batch, [data-component="CompanyBatch"], [class*="batch"]'))
+            || new URLSearchParams(location.search).get('batch') || '';
+    } catch (e) {}
+    return out;
+"""
 
 # ----------------------
 # Logging
@@ -60,6 +184,59 @@ rot_handler.setFormatter(logging.Formatter("%(asctime)s - %(levelname)s - %(mess
 logger.addHandler(rot_handler)
 logger.addHandler(logging.StreamHandler())
 
+# ----------------------
+# URL parsing
+# ----------------------
+# A company page: relative or absolute /companies/<slug>, nothing after the slug but a query or fragment
+COMPANY_URL_RE = re.compile(r"^(?:https?://(?:www\.)?ycombinator\.com)?/companies/([a-z0-9-]+)/?(?:[?#]|$)")
+# Directory pages that share the /companies/<slug> shape
+NON_COMPANY_SLUGS = frozenset(["founders", "directory"])
+
+@lru_cache(maxsize=100_000)  # the same hrefs come back on every scroll
+def _parse_company_slug(href: str) -> Optional[str]:
+    """Return the company slug an anchor href points to, or None if it isn't a company page."""
+    m = COMPANY_URL_RE.match(href)
+    if not m or m.group(1) in NON_COMPANY_SLUGS:
+        return None
+    return m.group(1)
+
+def company_url(slug: str) -> str:
+    """Build the canonical company page URL for a slug."""
+    return f"{BASE_URL}/{slug}"
+
+def _to_slug(value: str) -> Optional[str]:
+    """Accept a stored slug or a full company URL (older files) and return the slug."""
+    return _parse_company_slug(value) if '/' in value else value
+
+def _to_slugs(values) -> Set[str]:
+    return {slug for slug in map(_to_slug, values) if slug}
+
+# ----------------------
+# File helpers
+# ----------------------
+def _atomic_write_json(path: str, obj: Any):
+    """Write obj as JSON to a temp file, fsync it, then swap it into place."""
+    tmp = path + '.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(orjson.dumps(obj))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+# ----------------------
+# Chromedriver
+# ----------------------
+_CHROMEDRIVER_PATH: Optional[str] = None
+_chromedriver_lock = Lock()
+
+def _chromedriver_path() -> str:
+    """Resolve (and download if needed) chromedriver once per process."""
+    global _CHROMEDRIVER_PATH
+    with _chromedriver_lock:
+        if _CHROMEDRIVER_PATH is None:
+            _CHROMEDRIVER_PATH = ChromeDriverManager().install()
+        return _CHROMEDRIVER_PATH
+
 # ----------------------
 # Retry Decorator
 # ----------------------
@@ -82,20 +259,43 @@ def retry(exceptions, tries=3, delay=1, backoff=2):
 # ----------------------
 # Scraper
 # ----------------------
+class CompanyGone(Exception):
+    """The company page no longer exists, so there is nothing to scrape."""
+
 class YCBulkScraper:
-    def __init__(self, headless: bool=True, resume: bool=False, threads: int=4):
+    def __init__(self, headless: bool=True, resume: bool=False, threads: int=4, debug: bool=False):
         self.headless = headless
+        self.debug = debug  # save screenshots / page source for diagnosing page changes
+        # Debug artifacts are captured in memory and written to disk off the scraping threads
+        self.debug_pool: Optional[ThreadPoolExecutor] = ThreadPoolExecutor(max_workers=2) if debug else None
         self.resume = resume
         self.num_threads = max(1, threads)
         self.url_lock = Lock()
         self.checkpoint_lock = Lock()
         self.file_lock = Lock()
 
+        # Companies are tracked by slug; full URLs are only built for requests and output files
         self.company_urls: Set[str] = set()
         self.processed_urls: Set[str] = set()
-        self.batch_urls: Dict[str, Set[str]] = {}  # Track URLs by batch
+        self.batch_urls: Dict[str, Set[str]] = {}  # Track slugs by batch
         self.progress = 0
         self.completed_batches: Set[str] = set()  # Track completed batches
+        self.saved_url_count = 0  # size of company_urls at the last write of urls_file
+        self.algolia_creds: Optional[Tuple[str, str]] = None  # (app id, search key), fetched lazily
+        self.algolia_lookup_done = False  # set after the first lookup, even a failed one
+        self.algolia_lock = Lock()
+        self.driver_pool: Queue = Queue()  # idle browsers, reused by link collection and detail workers
+        self.cache_slot_locks: Dict[int, Any] = {}  # cache slot -> held lock file, per running browser
+        self.cache_slot_lock = Lock()
+        self.jsonl_fh = None  # shared append handle, open only while scrape_all runs
+        # Plain-HTTP fast path for detail pages, set up by scrape_all
+        self.http: Optional[requests.Session] = None
+        self.http_limiter = RateLimiter(REQUESTS_PER_SECOND)
+        self.slug_batches: Dict[str, str] = {}
+
+        if debug:
+            os.makedirs(batch_debug_dir, exist_ok=True)
+            os.makedirs(company_debug_dir, exist_ok=True)
 
         if resume:
             self._load_urls()
@@ -112,25 +312,183 @@ class YCBulkScraper:
         opts.add_argument("--window-size=1920,1080")
         opts.add_argument("--disable-notifications")
         opts.add_argument("--disable-popup-blocking")
+        opts.add_argument("--disable-extensions")
+        # Logo URLs are read from <img src>, so images never need to be downloaded or decoded;
+        # this also catches extensionless CDN images that BLOCKED_URL_PATTERNS misses
+        opts.add_argument("--blink-settings=imagesEnabled=false")
+        opts.add_experimental_option("prefs", CHROME_PREFS)
         opts.add_argument(f"--user-agent={random.choice(USER_AGENTS)}")
-        drv = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=opts)
+        slot = self._claim_cache_slot()
+        opts.add_argument(f"--disk-cache-dir={os.path.abspath(os.path.join(chrome_cache_dir, str(slot)))}")
+        opts.add_argument(f"--disk-cache-size={CHROME_CACHE_SIZE}")
+        try:
+            drv = webdriver.Chrome(service=Service(_chromedriver_path()), options=opts)
+        except Exception:
+            self._free_cache_slot(slot)
+            raise
+        drv.cache_slot = slot
         drv.implicitly_wait(IMPLICIT_WAIT)
+        drv.execute_cdp_cmd('Network.enable', {})
+        drv.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
         return drv
 
-    def parse_url(self, href: str) -> Optional[str]:
-        if not href:
-            return None
-        if href.startswith("/companies/"):
-            url = f"https://www.ycombinator.com{href.split('?')[0]}"
-            if "/founders" in url or "/directory" in url or url.endswith("/companies"):
-                return None
-            return url
-        if 'ycombinator.com/companies/' in href:
-            url = href.split('?')[0]
-            if "/founders" in url or "/directory" in url or url.endswith("/companies"):
-                return None
-            return url
-        return None
+    def _claim_cache_slot(self) -> int:
+        """Lock the lowest cache slot no running browser, in this or another process, is using."""
+        os.makedirs(chrome_cache_dir, exist_ok=True)
+        with self.cache_slot_lock:
+            slot = 0
+            while True:
+                if slot not in self.cache_slot_locks:
+                    fh = open(os.path.join(chrome_cache_dir, f"{slot}.lock"), "w")
+                    try:
+                        if fcntl:
+                            fcntl.flock(fh, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    except OSError:
+                        fh.close()  # held by another scraper process
+                    else:
+                        self.cache_slot_locks[slot] = fh
+                        return slot
+                slot += 1
+
+    def _free_cache_slot(self, slot: int):
+        with self.cache_slot_lock:
+            fh = self.cache_slot_locks.pop(slot, None)
+        if fh:
+            fh.close()  # closing the file releases the flock
+
+    def _quit_driver(self, drv: webdriver.Chrome):
+        """Quit a browser and hand its cache slot back."""
+        try:
+            drv.quit()
+        except Exception as e:
+            logger.debug(f"Error quitting driver: {e}")
+        finally:
+            self._free_cache_slot(drv.cache_slot)
+
+    def _acquire_driver(self) -> webdriver.Chrome:
+        """Take an idle browser from the pool, starting a new one only if none is free."""
+        try:
+            return self.driver_pool.get_nowait()
+        except Empty:
+            return self._init_driver()
+
+    def _release_driver(self, drv: webdriver.Chrome):
+        """Hand a browser back to the pool, dropping it if its session has died."""
+        try:
+            drv.current_url  # cheap round trip that fails once the session is gone
+        except WebDriverException:
+            logger.warning("Discarding dead browser session")
+            self._quit_driver(drv)
+            return
+        self.driver_pool.put(drv)
+
+    def close(self):
+        """Quit every pooled browser and finish any pending debug writes."""
+        if self.debug_pool:
+            self.debug_pool.shutdown(wait=True)
+            self.debug_pool = None
+        while True:
+            try:
+                drv = self.driver_pool.get_nowait()
+            except Empty:
+                break
+            self._quit_driver(drv)
+
+    def _write_debug(self, path: str, data: bytes):
+        """Write a debug artifact on the debug pool (inline once the pool has been shut down)."""
+        def write():
+            try:
+                with open(path, "wb") as f:
+                    f.write(data)
+            except OSError as e:
+                logger.debug(f"Debug write failed for {path}: {e}")
+        if self.debug_pool:
+            self.debug_pool.submit(write)
+        else:
+            write()
+
+    def _debug_screenshot(self, driver: webdriver.Chrome, path: str):
+        try:
+            self._write_debug(path, driver.get_screenshot_as_png())
+        except WebDriverException as e:
+            logger.debug(f"Screenshot failed for {path}: {e}")
+
+    def _get_algolia_creds(self, session: requests.Session) -> Optional[Tuple[str, str]]:
+        """
+        Read the public Algolia app id and search key from the directory page.
+        The lookup runs once per scraper; if it fails every batch goes straight to scrolling.
+        """
+        with self.algolia_lock:
+            if not self.algolia_lookup_done:
+                try:
+                    resp = session.get(BASE_URL, timeout=15)
+                    resp.raise_for_status()
+                    m = ALGOLIA_OPTS_RE.search(resp.text)
+                    if m:
+                        opts = orjson.loads(m.group(1))
+                        self.algolia_creds = (opts["app"], opts["key"])
+                    else:
+                        logger.warning("AlgoliaOpts not found on directory page")
+                except (requests.RequestException, ValueError, KeyError, TypeError) as e:
+                    logger.warning(f"Algolia credential lookup failed: {e}")
+                finally:
+                    self.algolia_lookup_done = True
+            return self.algolia_creds
+
+    @retry(requests.RequestException)
+    def _collect_batch_api(self, session: requests.Session, batch: str) -> Set[str]:
+        """Collect company URLs for a batch from the directory's Algolia index."""
+        creds = self._get_algolia_creds(session)
+        if not creds:
+            return set()
+        app_id, api_key = creds
+        headers = {"x-algolia-application-id": app_id, "x-algolia-api-key": api_key}
+
+        batch_urls = set()
+        page, nb_pages = 0, 1
+        while page < nb_pages:
+            params = urlencode({
+                "facetFilters": json.dumps([[f"batch:{batch}"]]),
+                "hitsPerPage": ALGOLIA_HITS_PER_PAGE,
+                "page": page,
+                "attributesToRetrieve": json.dumps(["slug"]),
+            })
+            resp = session.post(
+                ALGOLIA_URL,
+                headers=headers,
+                json={"requests": [{"indexName": ALGOLIA_INDEX, "params": params}]},
+                timeout=15
+            )
+            resp.raise_for_status()
+            result = resp.json()["results"][0]
+            for hit in result.get("hits", []):
+                if hit.get("slug"):
+                    batch_urls.add(hit['slug'])
+            nb_pages = result.get("nbPages", 0)
+            page += 1
+
+        logger.info(f"Batch {batch}: {len(batch_urls)} URLs from the Algolia index")
+        return batch_urls
+
+    def _collect_links(self, driver: webdriver.Chrome) -> Set[str]:
+        """Return slugs of companies linked on the page that earlier calls have not returned."""
+        hrefs = driver.execute_script(COLLECT_LINKS_JS) or []
+        return {slug for slug in map(_parse_company_slug, filter(None, hrefs)) if slug}
+
+    def _wait_for_network_idle(self, driver: webdriver.Chrome,
+                               quiet: float = IDLE_QUIET, timeout: float = IDLE_TIMEOUT):
+        """Return once the page stops loading new resources, or after timeout seconds."""
+        deadline = time.monotonic() + timeout
+        count = driver.execute_script(RESOURCE_COUNT_JS)
+        stable_since = time.monotonic()
+        while time.monotonic() < deadline:
+            time.sleep(IDLE_POLL)
+            new_count = driver.execute_script(RESOURCE_COUNT_JS)
+            now = time.monotonic()
+            if new_count != count:
+                count, stable_since = new_count, now
+            elif now - stable_since >= quiet:
+                return
 
     @retry(Exception)
     def _scroll_and_collect_batch(self, driver: webdriver.Chrome, batch: str) -> Set[str]:
@@ -148,9 +506,8 @@ class YCBulkScraper:
         except Exception as e:
             logger.warning(f"Timeout waiting for page to load for batch {batch}: {e}")
             # Take a screenshot to diagnose the issue
-            debug_dir = os.path.join(data_dir, "debug", "batches")
-            os.makedirs(debug_dir, exist_ok=True)
-            driver.save_screenshot(os.path.join(debug_dir, f"{batch}_timeout.png"))
+            if self.debug:
+                self._debug_screenshot(driver, os.path.join(batch_debug_dir, f"{batch}_timeout.png"))
             return batch_urls
         
         last_h = driver.execute_script("return document.body.scrollHeight")
@@ -158,20 +515,12 @@ class YCBulkScraper:
         stagnant = 0
         consecutive_no_new_links = 0  # Track consecutive scrolls with no new links
 
-        # Debug directory
-        debug_dir = os.path.join(data_dir, "debug", "batches")
-        os.makedirs(debug_dir, exist_ok=True)
-        
         # Take initial screenshot
-        driver.save_screenshot(os.path.join(debug_dir, f"{batch}_initial.png"))
+        if self.debug:
+            self._debug_screenshot(driver, os.path.join(batch_debug_dir, f"{batch}_initial.png"))
         
         # Initial count of links before scrolling
-        initial_links = set()
-        elems = driver.find_elements(By.CSS_SELECTOR, "a[href*='/companies/']")
-        for e in elems:
-            url = self.parse_url(e.get_attribute('href'))
-            if url:
-                initial_links.add(url)
+        initial_links = self._collect_links(driver)
         
         batch_urls.update(initial_links)
         logger.info(f"Found {len(initial_links)} initial links for batch {batch}")
@@ -182,72 +531,31 @@ class YCBulkScraper:
             # Try different scrolling strategies
             
             # 1. Try clicking "Show more" button if present
-            try:
-                btn = driver.find_element(By.XPATH, "//button[contains(., 'Show') and contains(., 'more')]")
-                if btn.is_displayed():
-                    btn.click()
-                    time.sleep(SCROLL_PAUSE)
-                    logger.info(f"Clicked 'Show more' button for batch {batch}")
-                    consecutive_no_new_links = 0  # Reset consecutive counter on button click
-                    continue
-            except:
-                pass
+            btns = driver.find_elements(By.XPATH, "//button[contains(., 'Show') and contains(., 'more')]")
+            if btns:
+                try:
+                    if btns[0].is_displayed():
+                        btns[0].click()
+                        self._wait_for_network_idle(driver)
+                        logger.info(f"Clicked 'Show more' button for batch {batch}")
+                        consecutive_no_new_links = 0  # Reset consecutive counter on button click
+                        continue
+                except WebDriverException as e:  # stale or covered button, fall back to scrolling
+                    logger.debug(f"'Show more' click failed for batch {batch}: {e}")
             
             # 2. Regular scroll to bottom
             driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(SCROLL_PAUSE + random.random()*0.5)
+            self._wait_for_network_idle(driver)
             
             # 3. Occasionally do a scroll up and down to trigger different loading
             if i % 5 == 0:
                 driver.execute_script("window.scrollTo(0, document.body.scrollHeight * 0.8);")
-                time.sleep(0.5)
+                time.sleep(0.5)  # give the scroll observer a chance to see the sentinel leave the viewport
                 driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(0.5)
+                self._wait_for_network_idle(driver)
 
-            # Collect links using different methods
-            all_links = set()
-            
-            # Method 1: Direct links
-            elems = driver.find_elements(By.CSS_SELECTOR, "a[href*='/companies/']")
-            for e in elems:
-                url = self.parse_url(e.get_attribute('href'))
-                if url:
-                    all_links.add(url)
-            
-            # Method 2: Try to find containers with company cards
-            try:
-                containers = driver.find_elements(By.CSS_SELECTOR, ".company_card, [class*='company'], [class*='card']")
-                for container in containers:
-                    links = container.find_elements(By.TAG_NAME, "a")
-                    for link in links:
-                        url = self.parse_url(link.get_attribute('href'))
-                        if url:
-                            all_links.add(url)
-            except:
-                pass
-                
-            # Method 3: Use JavaScript to find all company links
-            try:
-                js_links = driver.execute_script("""
-                    const links = [];
-                    document.querySelectorAll('a').forEach(a => {
-                        const href = a.getAttribute('href');
-                        if (href && href.includes('/companies/') && 
-                            !href.endsWith('/companies') && 
-                            !href.includes('/founders') && 
-                            !href.includes('/directory')) {
-                            links.push(href);
-                        }
-                    });
-                    return links;
-                """)
-                
-                for href in js_links:
-                    url = self.parse_url(href)
-                    if url:
-                        all_links.add(url)
-            except Exception as e:
-                logger.debug(f"JS extraction failed for batch {batch}: {e}")
+            # Collect links in a single script call
+            all_links = self._collect_links(driver)
             
             # Add all links to our batch set
             batch_urls.update(all_links)
@@ -272,8 +580,8 @@ class YCBulkScraper:
                 last_h = new_h
                 
             # Take screenshots periodically
-            if i % 50 == 0 and i > 0:
-                driver.save_screenshot(os.path.join(debug_dir, f"{batch}_scroll_{i}.png"))
+            if self.debug and i % 50 == 0 and i > 0:
+                self._debug_screenshot(driver, os.path.join(batch_debug_dir, f"{batch}_scroll_{i}.png"))
                 
             # Exit conditions
             
@@ -287,60 +595,82 @@ class YCBulkScraper:
                 logger.info(f"Batch {batch}: Page height unchanged after {stagnant} scrolls, breaking.")
                 break
 
-        # Take final screenshot
-        driver.save_screenshot(os.path.join(debug_dir, f"{batch}_final.png"))
-        
-        # Save page source for debugging
-        with open(os.path.join(debug_dir, f"{batch}_final.html"), "w", encoding="utf-8") as f:
-            f.write(driver.page_source)
+        # Take final screenshot and save page source for debugging
+        if self.debug:
+            self._debug_screenshot(driver, os.path.join(batch_debug_dir, f"{batch}_final.png"))
+            self._write_debug(os.path.join(batch_debug_dir, f"{batch}_final.html"), driver.page_source.encode("utf-8"))
             
         logger.info(f"Batch {batch}: Collection completed with {len(batch_urls)} URLs")
         return batch_urls
 
+    def _collect_one_batch(self, session: requests.Session, batch: str) -> Set[str]:
+        """Collect one batch's URLs, falling back to scrolling the page in a pooled browser."""
+        try:
+            batch_urls = self._collect_batch_api(session, batch)
+        except (requests.RequestException, ValueError, KeyError, IndexError) as e:
+            logger.warning(f"Algolia lookup failed for batch {batch}: {e}")
+            batch_urls = set()
+        if not batch_urls:
+            drv = self._acquire_driver()
+            try:
+                batch_urls = self._scroll_and_collect_batch(drv, batch)
+            finally:
+                self._release_driver(drv)
+        
+        # Random delay before this worker takes the next batch, to avoid blocking
+        delay = random.uniform(2, 5)
+        logger.info(f"Batch {batch} done, waiting {delay:.2f}s before next batch...")
+        time.sleep(delay)
+        return batch_urls
+
     def get_company_links_by_batch(self):
         """Collect company URLs by iterating through each batch."""
         if self.resume and self.company_urls:
             logger.info(f"Resuming with {len(self.company_urls)} preloaded URLs")
             return
 
-        drv = self._init_driver()
+        pending = []
+        for batch in BATCHES:
+            # Skip if we've already processed this batch
+            if batch in self.completed_batches:
+                logger.info(f"Skipping already completed batch: {batch}")
+            else:
+                pending.append(batch)
+
+        # Batches are independent, so several are collected at once; results are
+        # recorded and saved here on the calling thread as each one finishes
+        session = requests.Session()
+        session.headers.update({"User-Agent": random.choice(USER_AGENTS)})
         try:
-            for batch in BATCHES:
-                # Skip if we've already processed this batch
-                if batch in self.completed_batches:
-                    logger.info(f"Skipping already completed batch: {batch}")
-                    continue
-                
-                # Collect URLs for this batch
-                batch_urls = self._scroll_and_collect_batch(drv, batch)
-                
-                # Store batch URLs and save
-                self.batch_urls[batch] = batch_urls
-                self._save_batch_urls(batch, batch_urls)
-                
-                # Update overall URL set
-                self.company_urls.update(batch_urls)
-                
-                # Mark batch as completed
-                self.completed_batches.add(batch)
-                self._save_batch_status()
-                
-                # Save overall URLs
-                self._save_urls()
-                
-                # Random delay between batches to avoid blocking
-                delay = random.uniform(2, 5)
-                logger.info(f"Waiting {delay:.2f}s before next batch...")
-                time.sleep(delay)
-                
-        except Exception as e:
-            logger.error(f"Error during batch collection: {e}")
-            logger.error(traceback.format_exc())
+            with ThreadPoolExecutor(max_workers=self.num_threads) as ex:
+                futures = {ex.submit(self._collect_one_batch, session, batch): batch for batch in pending}
+                for future in as_completed(futures):
+                    batch = futures[future]
+                    try:
+                        batch_urls = future.result()
+                    except Exception as e:
+                        logger.error(f"Error collecting batch {batch}: {e}")
+                        logger.error(traceback.format_exc())
+                        continue
+                    
+                    # Store batch URLs and save
+                    self.batch_urls[batch] = batch_urls
+                    self._save_batch_urls(batch, batch_urls)
+                    
+                    # Update overall URL set
+                    self.company_urls.update(batch_urls)
+                    
+                    # Mark batch as completed
+                    self.completed_batches.add(batch)
+                    self._save_batch_status()
+                    
+                    # Save overall URLs
+                    self._save_urls()
         finally:
-            drv.quit()
+            session.close()
             
         # Final save
-        self._save_urls()
+        self._save_urls(force=True)
         self._save_batch_status()
         logger.info(f"Total URLs collected across all batches: {len(self.company_urls)}")
 
@@ -349,19 +679,23 @@ class YCBulkScraper:
             return
             
         try:
-            with open(urls_file,'r') as f:
-                self.company_urls=set(json.load(f))
+            with open(urls_file,'rb') as f:
+                self.company_urls=_to_slugs(orjson.loads(f.read()))
+            self.saved_url_count=len(self.company_urls)
             logger.info(f"Loaded {len(self.company_urls)} URLs")
         except Exception as e:
             logger.error(f"Failed loading URLs: {e}")
 
-    def _save_urls(self):
+    def _save_urls(self, force: bool=False):
+        # Each finished batch is already on disk in batch_urls_dir, so mid-run
+        # the full list is only rewritten once enough new URLs have piled up
         with self.url_lock:
+            if not force and len(self.company_urls) - self.saved_url_count < URLS_SAVE_THRESHOLD:
+                return
             try:
-                tmp=urls_file+'.tmp'
-                with open(tmp,'w') as f:
-                    json.dump(list(self.company_urls),f)
-                os.replace(tmp,urls_file)
+                # Full URLs on disk: yc_company_bs4 reads this file as-is
+                _atomic_write_json(urls_file, [company_url(s) for s in self.company_urls])
+                self.saved_url_count = len(self.company_urls)
                 logger.info(f"Saved {len(self.company_urls)} URLs")
             except Exception as e:
                 logger.error(f"Failed saving URLs: {e}")
@@ -370,10 +704,7 @@ class YCBulkScraper:
         """Save URLs for a specific batch."""
         batch_file = os.path.join(batch_urls_dir, f"{batch}_urls.json")
         try:
-            tmp=batch_file+'.tmp'
-            with open(tmp,'w') as f:
-                json.dump(list(urls),f)
-            os.replace(tmp,batch_file)
+            _atomic_write_json(batch_file, [company_url(s) for s in urls])
             logger.info(f"Saved {len(urls)} URLs for batch {batch}")
         except Exception as e:
             logger.error(f"Failed saving batch URLs for {batch}: {e}")
@@ -385,16 +716,18 @@ class YCBulkScraper:
             return
             
         try:
-            with open(status_file,'r') as f:
-                data = json.load(f)
+            with open(status_file,'rb') as f:
+                data = orjson.loads(f.read())
                 self.completed_batches = set(data.get('completed_batches', []))
                 
                 # Also load the individual batch URLs
                 for batch in self.completed_batches:
                     batch_file = os.path.join(batch_urls_dir, f"{batch}_urls.json")
                     if os.path.exists(batch_file):
-                        with open(batch_file, 'r') as bf:
-                            self.batch_urls[batch] = set(json.load(bf))
+                        with open(batch_file, 'rb') as bf:
+                            self.batch_urls[batch] = _to_slugs(orjson.loads(bf.read()))
+                        # Batches finished after the last urls_file write are only here
+                        self.company_urls.update(self.batch_urls[batch])
                     
             logger.info(f"Loaded {len(self.completed_batches)} completed batches")
         except Exception as e:
@@ -404,13 +737,10 @@ class YCBulkScraper:
         """Save the status of which batches have been completed."""
         status_file = os.path.join(data_dir, "batch_status.json")
         try:
-            tmp=status_file+'.tmp'
-            with open(tmp,'w') as f:
-                json.dump({
-                    'completed_batches': list(self.completed_batches),
-                    'ts': time.time()
-                },f)
-            os.replace(tmp,status_file)
+            _atomic_write_json(status_file, {
+                'completed_batches': list(self.completed_batches),
+                'ts': time.time()
+            })
             logger.info(f"Saved batch status ({len(self.completed_batches)} completed)")
         except Exception as e:
             logger.error(f"Failed saving batch status: {e}")
@@ -420,20 +750,26 @@ class YCBulkScraper:
             return
             
         try:
-            with open(checkpoint_file,'r') as f:
-                data=json.load(f)
-                self.processed_urls=set(data.get('processed_urls',[]))
+            with open(checkpoint_file,'rb') as f:
+                data=orjson.loads(f.read())
+                self.processed_urls=_to_slugs(data.get('processed_slugs') or data.get('processed_urls',[]))
             logger.info(f"Loaded {len(self.processed_urls)} processed URLs")
         except Exception as e:
             logger.error(f"Failed loading checkpoint: {e}")
 
+    def _flush_jsonl(self):
+        """Push buffered records to disk so the checkpoint never runs ahead of the data."""
+        with self.file_lock:
+            if self.jsonl_fh:
+                self.jsonl_fh.flush()
+
     def _save_checkpoint(self):
         with self.checkpoint_lock:
+            # Flush under the lock, before the snapshot: a slug is only added after its line
+            # was written, so every slug in the snapshot is covered by this flush
+            self._flush_jsonl()
             try:
-                tmp=checkpoint_file+'.tmp'
-                with open(tmp,'w') as f:
-                    json.dump({'processed_urls':list(self.processed_urls),'ts':time.time()},f)
-                os.replace(tmp,checkpoint_file)
+                _atomic_write_json(checkpoint_file, {'processed_slugs':list(self.processed_urls),'ts':time.time()})
                 logger.info(f"Checkpoint saved ({len(self.processed_urls)} URLs)")
             except Exception as e:
                 logger.error(f"Failed saving checkpoint: {e}")
@@ -443,112 +779,23 @@ class YCBulkScraper:
         driver.get(url)
         try:
             WebDriverWait(driver,10).until(EC.presence_of_element_located((By.TAG_NAME,'h1')))
-        except:
+        except TimeoutException:
             logger.warning(f"Slow load: {url}")
 
-        # Company Name
-        name='Unknown'
-        h1=driver.find_elements(By.CSS_SELECTOR,'h1')
-        if h1: name=h1[0].text.strip()
-
-        # Blurb - try multiple selectors including the specific class mentioned
-        blurb=''
-        blurb_selectors = [
-            ".prose.hidden.max-w-full.md\\:block",  # Specific class with escaped colon
-            ".prose.hidden.max-w-full",             # Without md:block
-            "div.prose.hidden",                     # Just the main classes
-            ".tagline", 
-            "[data-component='CompanyTagline']"
-        ]
-        
-        # Try each selector individually
-        for selector in blurb_selectors:
-            be = driver.find_elements(By.CSS_SELECTOR, selector)
-            for elem in be:
-                text = elem.text.strip()
-                if text:
-                    blurb = text
-                    break
-            if blurb:
-                break
-        
-        # If still no blurb, try JavaScript as a fallback
-        if not blurb:
-            try:
-                blurb = driver.execute_script("""
-                    // Try specific classes first
-                    const elements = document.querySelectorAll('.prose.hidden, .prose.hidden.max-w-full, .prose.hidden.max-w-full.md\\\\:block');
-                    for (const el of elements) {
-                        if (el.textContent.trim()) return el.textContent.trim();
-                    }
-                    
-                    // Fallback to short paragraphs that could be taglines
-                    const paragraphs = document.querySelectorAll('p, h2, h3');
-                    for (const p of paragraphs) {
-                        const text = p.textContent.trim();
-                        if (text && text.length > 10 && text.length < 200) return text;
-                    }
-                    return '';
-                """)
-            except Exception as e:
-                logger.debug(f"JS blurb extraction error: {e}")
-
-        # Description
-        desc=''
-        for sel in ['.prose.max-w-full.whitespace-pre-line','div.prose.max-w-full','.company-description']:
-            ds=driver.find_elements(By.CSS_SELECTOR,sel)
-            texts=[e.text.strip() for e in ds if e.text.strip()]
-            if texts:
-                desc=' '.join(texts)
-                break
+        # All fields in one round trip; selector fallbacks are evaluated in the page
+        fields=driver.execute_script(EXTRACT_DETAIL_JS) or {}
+        name=fields.get('name') or 'Unknown'
+        blurb=fields.get('blurb') or ''
+        desc=fields.get('description') or ''
+        logo=fields.get('logo') or ''
 
-        # Logo
-        logo=''
-        for sel in ['.company-logo img','[data-component=\'CompanyLogo\'] img','img[alt*=logo]', 'header img', '.logo img']:
-            ls=driver.find_elements(By.CSS_SELECTOR,sel)
-            for e in ls:
-                src=e.get_attribute('src')
-                if src and src.endswith(tuple(['.png','.jpg','.jpeg','.svg'])):
-                    logo=src; break
-            if logo: break
-        if not logo:
-            try:
-                logo=driver.execute_script("""
-                    let imgs=[...document.querySelectorAll('img')];
-                    for(let i of imgs){if(/\\.(png|jpe?g|svg)$/.test(i.src))return i.src;}return '';
-                """)
-            except:
-                pass
-
-        # Get batch information if available
-        batch = ''
-        try:
-            # Try to find batch information on the page
-            batch_elem = driver.find_elements(By.CSS_SELECTOR, '.batch, [data-component="CompanyBatch"], [class*="batch"]')
-            if batch_elem:
-                batch = batch_elem[0].text.strip()
-            
-            # If not found on page, try to extract from URL parameters
-            if not batch and "batch=" in driver.current_url:
-                batch_param = driver.current_url.split("batch=")[1].split("&")[0]
-                if batch_param:
-                    batch = batch_param
-                    
-            # Clean up batch string
-            if batch:
-                # Remove any "Batch: " or similar prefix
-                batch = batch.replace("Batch:", "").replace("Batch", "").strip()
-        except Exception as e:
-            logger.debug(f"Error extracting batch: {e}")
+        # Clean up batch string: remove any "Batch: " or similar prefix
+        batch=(fields.get('batch') or '').replace("Batch:", "").replace("Batch", "").strip()
 
         # Take screenshot for debugging
-        debug_dir = os.path.join(data_dir, "debug", "companies")
-        os.makedirs(debug_dir, exist_ok=True)
-        company_slug = url.split('/')[-1]
-        try:
-            driver.save_screenshot(os.path.join(debug_dir, f"{company_slug}.png"))
-        except:
-            pass
+        if self.debug:
+            company_slug = url.split('/')[-1]
+            self._debug_screenshot(driver, os.path.join(company_debug_dir, f"{company_slug}.png"))
 
         return {
             'name': name,
@@ -560,63 +807,138 @@ class YCBulkScraper:
             'scraped_at': time.strftime('%Y-%m-%d %H:%M:%S')
         }
 
+    def _scrape_static(self, slug: str) -> Optional[Dict[str, Any]]:
+        """Build the record from the server-rendered page; None if the browser is needed.
+
+        Raises CompanyGone if the page has been taken down (404/410).
+        """
+        url = company_url(slug)
+        self.http_limiter.acquire()
+        try:
+            data = scrape_company(url, self.http)
+        except requests.HTTPError as e:
+            if e.response is not None and e.response.status_code in GONE_STATUSES:
+                raise CompanyGone(url) from e
+            logger.debug(f"Static fetch failed for {url}: {e}")
+            return None
+        except requests.RequestException as e:
+            logger.debug(f"Static fetch failed for {url}: {e}")
+            return None
+        if not data['title'] or not (data['blurb'] or data['description']):
+            return None
+        return {
+            'name': data['title'],
+            'blurb': data['blurb'] or '',
+            'description': data['description'] or '',
+            'logo_url': data['profile_picture'] or '',
+            'batch': self.slug_batches.get(slug, ''),
+            'url': url,
+            'scraped_at': time.strftime('%Y-%m-%d %H:%M:%S')
+        }
+
     def worker(self, idx:int, q:Queue, total:int):
-        drv=self._init_driver()
+        drv=None  # only started for pages the static path can't handle
         while True:
-            try: url=q.get_nowait()
+            try: slug=q.get_nowait()
             except Empty: break
-            if url in self.processed_urls:
+            if slug in self.processed_urls:
                 q.task_done(); continue
+            url=company_url(slug)
             try:
-                detail=self.scrape_detail(drv,url)
-                with self.file_lock, open(jsonl_file,'a') as f:
-                    f.write(json.dumps(detail,ensure_ascii=False)+"\n")
+                try:
+                    detail=self._scrape_static(slug)
+                    if detail is None:
+                        if drv is None: drv=self._acquire_driver()
+                        detail=self.scrape_detail(drv,url)
+                except CompanyGone:
+                    detail=None  # nothing to write, but mark it processed so resumes skip it
+                if detail is not None:
+                    line=orjson.dumps(detail)+b"\n"
+                    with self.file_lock:
+                        self.jsonl_fh.write(line)
                 with self.checkpoint_lock:
-                    self.processed_urls.add(url)
+                    self.processed_urls.add(slug)
                     self.progress+=1
-                    if self.progress%CHECKPOINT_INTERVAL==0: self._save_checkpoint()
-                logger.info(f"[T{idx}] {self.progress}/{total} {detail['name']} - Blurb: {bool(detail['blurb'])} - Batch: {detail.get('batch', 'Unknown')}")
+                    save=self.progress%CHECKPOINT_INTERVAL==0
+                # _save_checkpoint takes checkpoint_lock itself, so call it only after releasing it
+                if save: self._save_checkpoint()
+                if detail is None:
+                    logger.info(f"[T{idx}] {self.progress}/{total} Skipped {url} (page no longer exists)")
+                else:
+                    logger.info(f"[T{idx}] {self.progress}/{total} {detail['name']} - Blurb: {bool(detail['blurb'])} - Batch: {detail.get('batch', 'Unknown')}")
             except Exception as e:
                 logger.error(f"Worker {idx} error on {url}: {str(e)}")
                 logger.error(traceback.format_exc())
+                if isinstance(e, WebDriverException) and drv is not None:
+                    # Drop this browser if its session is gone; the next page that needs one starts fresh
+                    self._release_driver(drv); drv=None
             finally:
                 q.task_done()
-        drv.quit(); logger.info(f"Worker {idx} done")
+        if drv is not None: self._release_driver(drv)
+        logger.info(f"Worker {idx} done")
+
+    def _progress_monitor(self, total:int, done:Event, interval:float=10):
+        """Log scraping progress every interval seconds until done is set."""
+        while not done.wait(interval):
+            logger.info(f"{self.progress}/{total} scraped")
 
     def scrape_all(self,limit:int=0):
         # First collect all URLs by batch
         self.get_company_links_by_batch()
         
         # Then process the collected URLs
-        to=[u for u in self.company_urls if u not in self.processed_urls]
+        to=list(self.company_urls-self.processed_urls)
+        random.shuffle(to)  # spread concurrent workers across the list instead of hash order
         if limit>0: to=to[:limit]
         total=len(to)
         logger.info(f"Scraping {total} with {self.num_threads} threads")
-        q=Queue(); [q.put(u) for u in to]
+        q=Queue()
+        for u in to: q.put(u)
+        self.slug_batches={slug: batch for batch, slugs in self.batch_urls.items() for slug in slugs}
+        self.http=requests.Session()
+        self.http.headers.update({"User-Agent": random.choice(USER_AGENTS)})
+        retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+        self.http.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=self.num_threads, max_retries=retries))
+        self.jsonl_fh=open(jsonl_file,'ab',buffering=JSONL_BUFFER_SIZE)
         ths=[Thread(target=self.worker,args=(i,q,total),daemon=True) for i in range(min(self.num_threads,total))]
         for t in ths: t.start()
+        done=Event()
+        Thread(target=self._progress_monitor,args=(total,done),daemon=True).start()
         try:
-            while q.qsize(): logger.info(f"{q.qsize()}/{total} remaining"); time.sleep(10)
             q.join()
         except KeyboardInterrupt:
             logger.info("Interrupted, saving checkpoint"); self._save_checkpoint(); return
+        finally:
+            done.set()
+            with self.file_lock:
+                self.jsonl_fh.close(); self.jsonl_fh=None
+            self.http.close()
+        # Workers exit as soon as the queue is empty; wait for them to hand back their browsers
         for t in ths: t.join()
         self._save_checkpoint(); logger.info("Done scraping")
 
     def consolidate(self):
         if not os.path.exists(jsonl_file): return logger.warning("No data")
-        arr=[]
+        # Stream records straight into a JSON array; each line is only parsed to
+        # skip corrupt ones (e.g. a record cut short by a crash), never held in memory
+        count=0
         try:
-            with open(jsonl_file) as f: 
+            tmp=json_file+'.tmp'
+            with open(jsonl_file,'rb') as f, open(tmp,'wb') as out:
+                out.write(b'[')
                 for l in f:
-                    if l.strip():
-                        try:
-                            arr.append(json.loads(l))
-                        except json.JSONDecodeError as e:
-                            logger.error(f"Error parsing JSONL line: {e}")
-            with open(json_file,'w') as f: 
-                json.dump(arr,f,indent=2)
-            logger.info(f"Consolidated {len(arr)} entries")
+                    l=l.strip()
+                    if not l: continue
+                    try:
+                        orjson.loads(l)
+                    except orjson.JSONDecodeError as e:
+                        logger.error(f"Error parsing JSONL line: {e}")
+                        continue
+                    out.write(b',\n' if count else b'\n'); out.write(l)
+                    count+=1
+                out.write(b'\n]\n')
+            os.replace(tmp,json_file)
+            logger.info(f"Consolidated {count} entries")
         except Exception as e:
             logger.error(f"Error during consolidation: {e}")
             logger.error(traceback.format_exc())
@@ -627,9 +949,10 @@ if __name__=='__main__':
     p.add_argument('--resume',action='store_true'); p.add_argument('--visible',action='store_true')
     p.add_argument('--links-only',action='store_true'); p.add_argument('--threads',type=int,default=4)
     p.add_argument('--batch',help='Scrape only a specific batch (e.g., W23)')
+    p.add_argument('--debug',action='store_true',help='Save screenshots and page source under data/debug')
     a=p.parse_args()
     
-    sc=YCBulkScraper(headless=not a.visible,resume=a.resume,threads=a.threads)
+    sc=YCBulkScraper(headless=not a.visible,resume=a.resume,threads=a.threads,debug=a.debug)
     
     # If a specific batch is provided, only scrape that batch
     if a.batch:
@@ -637,8 +960,11 @@ if __name__=='__main__':
         BATCHES = [a.batch]
         logger.info(f"Scraping only batch: {a.batch}")
     
-    if a.links_only: 
-        sc.get_company_links_by_batch()  # Changed to batch method
-    else: 
-        sc.scrape_all(a.limit)
-        sc.consolidate()
\ No newline at end of file
+    try:
+        if a.links_only: 
+            sc.get_company_links_by_batch()  # Changed to batch method
+        else: 
+            sc.scrape_all(a.limit)
+            sc.consolidate()
+    finally:
+        sc.close()
\ No newline at end of file